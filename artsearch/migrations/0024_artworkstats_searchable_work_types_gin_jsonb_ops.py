@@ -0,0 +1,25 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('artsearch', '0023_artmapdata_binary_geometry'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='artworkstats',
+            name='idx_searchable_work_types_gin',
+        ),
+        AddIndexConcurrently(
+            model_name='artworkstats',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['searchable_work_types'], name='idx_searchable_work_types_gin'),
+        ),
+    ]
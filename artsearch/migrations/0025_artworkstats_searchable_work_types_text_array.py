@@ -0,0 +1,56 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artsearch', '0024_artworkstats_searchable_work_types_gin_jsonb_ops'),
+    ]
+
+    operations = [
+        # Convert the JSONB array to a native text[] column. ALTER COLUMN ... TYPE
+        # cannot use a subquery in its USING clause, so the data is copied into a
+        # new column which then replaces the old one.
+        migrations.RunSQL(
+            sql="""
+                DROP INDEX IF EXISTS idx_searchable_work_types_gin;
+                ALTER TABLE artsearch_artworkstats
+                    ADD COLUMN searchable_work_types_arr text[];
+                UPDATE artsearch_artworkstats
+                    SET searchable_work_types_arr = ARRAY(
+                        SELECT jsonb_array_elements_text(searchable_work_types)
+                    );
+                ALTER TABLE artsearch_artworkstats
+                    DROP COLUMN searchable_work_types;
+                ALTER TABLE artsearch_artworkstats
+                    RENAME COLUMN searchable_work_types_arr TO searchable_work_types;
+                ALTER TABLE artsearch_artworkstats
+                    ALTER COLUMN searchable_work_types SET NOT NULL;
+                CREATE INDEX idx_searchable_work_types_gin
+                    ON artsearch_artworkstats USING GIN (searchable_work_types);
+            """,
+            reverse_sql="""
+                DROP INDEX IF EXISTS idx_searchable_work_types_gin;
+                ALTER TABLE artsearch_artworkstats
+                    ADD COLUMN searchable_work_types_json jsonb;
+                UPDATE artsearch_artworkstats
+                    SET searchable_work_types_json = to_jsonb(searchable_work_types);
+                ALTER TABLE artsearch_artworkstats
+                    DROP COLUMN searchable_work_types;
+                ALTER TABLE artsearch_artworkstats
+                    RENAME COLUMN searchable_work_types_json TO searchable_work_types;
+                ALTER TABLE artsearch_artworkstats
+                    ALTER COLUMN searchable_work_types SET NOT NULL;
+                CREATE INDEX idx_searchable_work_types_gin
+                    ON artsearch_artworkstats USING GIN (searchable_work_types);
+            """,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='artworkstats',
+                    name='searchable_work_types',
+                    field=django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), help_text='List of searchable work types for this artwork', size=None),
+                ),
+            ],
+        ),
+    ]
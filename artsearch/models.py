@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 
 
@@ -29,8 +30,9 @@ class ArtworkStats(models.Model):
     object_number = models.CharField(
         max_length=100, help_text="Stable and unique public artwork identifier"
     )
-    searchable_work_types = models.JSONField(
-        help_text="List of searchable work types for this artwork"
+    searchable_work_types = ArrayField(
+        models.TextField(),
+        help_text="List of searchable work types for this artwork",
     )
 
     class Meta:
@@ -43,13 +45,11 @@ class ArtworkStats(models.Model):
         indexes = [
             # Fast museum filtering
             models.Index(fields=["museum_slug"]),
-            # PostgreSQL GIN index with jsonb_path_ops for optimal JSONB array queries
-            # Optimized for @> (contains) and ?| (overlap) operators used in work type filtering
-            # jsonb_path_ops uses less space and is faster than default jsonb_ops for these operations
+            # PostgreSQL GIN index (array_ops) for the && (overlap) operator used
+            # in work type filtering.
             GinIndex(
                 fields=["searchable_work_types"],
                 name="idx_searchable_work_types_gin",
-                opclasses=["jsonb_path_ops"],
             ),
         ]
 
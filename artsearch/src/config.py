@@ -14,9 +14,12 @@ class Config(BaseModel):
     qdrant_api_key: str
     qdrant_collection_name_etl: str
     qdrant_collection_name_app: str
+    qdrant_prefer_grpc: bool = False
 
     django_secret_key: str
     device: str = "cuda" if torch.cuda.is_available() else "cpu"
+    clip_torch_compile: bool = False
+    clip_gpu_preprocess: bool = False
     allowed_hosts: list[str] = []
     debug: bool = False
     clip_model_name: ClipSelection
@@ -45,6 +48,9 @@ class Config(BaseModel):
     # Sentry (optional, for production error monitoring)
     sentry_dsn: str | None = None
 
+    # Persistent query embedding cache (empty string disables it)
+    embedding_cache_path: str = ""
+
 
 def create_config():
     env_files = [".env.dev", ".env.prod"]
@@ -59,9 +65,15 @@ def create_config():
     qdrant_api_key = os.getenv("QDRANT_API_KEY")
     qdrant_collection_name_app = os.getenv("QDRANT_COLLECTION_NAME_APP")
     qdrant_collection_name_etl = os.getenv("QDRANT_COLLECTION_NAME_ETL")
+    # Opt-in: gRPC sends vectors as packed floats instead of JSON, but needs
+    # the Qdrant gRPC port (6334) to be reachable
+    qdrant_prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "False").lower() == "true"
     django_secret_key = os.getenv("DJANGO_SECRET_KEY")
     device = os.getenv("DEVICE", "cuda" if torch.cuda.is_available() else "cpu")
     debug = os.getenv("DEBUG", "False").lower() == "true"
+    # Opt-in: compilation adds minutes to startup and needs a recent CUDA GPU
+    clip_torch_compile = os.getenv("CLIP_TORCH_COMPILE", "False").lower() == "true"
+    clip_gpu_preprocess = os.getenv("CLIP_GPU_PREPROCESS", "False").lower() == "true"
     allowed_hosts = os.getenv("ALLOWED_HOSTS", "").split(",")
 
     # AWS S3 / Linode Object Storage configuration
@@ -88,6 +100,10 @@ def create_config():
     # Sentry (optional)
     sentry_dsn = os.getenv("SENTRY_DSN")
 
+    # Persistent query embedding cache (optional)
+    # Off unless a path is set
+    embedding_cache_path = os.getenv("EMBEDDING_CACHE_PATH", "")
+
     if not qdrant_url:
         raise ValueError("QDRANT_URL is not set")
     if not qdrant_api_key:
@@ -130,8 +146,11 @@ def create_config():
         qdrant_api_key=qdrant_api_key,
         qdrant_collection_name_etl=qdrant_collection_name_etl,
         qdrant_collection_name_app=qdrant_collection_name_app,
+        qdrant_prefer_grpc=qdrant_prefer_grpc,
         django_secret_key=django_secret_key,
         device=device,
+        clip_torch_compile=clip_torch_compile,
+        clip_gpu_preprocess=clip_gpu_preprocess,
         allowed_hosts=allowed_hosts,
         debug=debug,
         clip_model_name="ViT-L/14",
@@ -150,6 +169,7 @@ def create_config():
         openai_api_key=openai_api_key,
         jina_api_key=jina_api_key,
         sentry_dsn=sentry_dsn,
+        embedding_cache_path=embedding_cache_path,
     )
 
 
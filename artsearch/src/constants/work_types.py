@@ -1,5 +1,5 @@
-# A set work types that the user can filter on in the search
-SEARCHABLE_WORK_TYPES = set(
+# A set work types that the user can filter on in the search (immutable)
+SEARCHABLE_WORK_TYPES = frozenset(
     [
         "drawing",
         "painting",
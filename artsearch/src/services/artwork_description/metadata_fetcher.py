@@ -4,6 +4,7 @@ from typing import Any
 import requests
 import xmltodict
 from artsearch.src.services.museum_clients.utils import get_museum_api_url
+from artsearch.src.utils.session_config import get_shared_session
 from .metadata_processors import (
     clean_smk_metadata,
     clean_cma_metadata,
@@ -42,7 +43,7 @@ def fetch_and_clean_metadata(
 
     # Fetch raw data
     try:
-        response = requests.get(api_url, timeout=API_TIMEOUT)
+        response = get_shared_session().get(api_url, timeout=API_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         raise ValueError(f"Failed to fetch metadata from museum API: {str(e)}")
@@ -54,11 +54,9 @@ def get_random_artwork_ids(
     if museums is not None:
         queryset = queryset.filter(museum_slug__in=museums)
 
-    # Apply work type filter using ?| operator (same pattern as museum_stats_service)
+    # Apply work type filter using && operator (same pattern as museum_stats_service)
     if work_types is not None:
-        queryset = queryset.extra(
-            where=["searchable_work_types ?| %s"], params=[work_types]
-        )
+        queryset = queryset.filter(searchable_work_types__overlap=work_types)
 
     # Deterministic random order using md5 hash with seed
     queryset = queryset.order_by(
@@ -1,15 +1,53 @@
+import logging
 import time
 from PIL import Image, UnidentifiedImageError
 from io import BytesIO
 import requests
-from typing import Tuple, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Tuple
 from functools import lru_cache
 import clip
 import torch
-from artsearch.src.utils.session_config import get_configured_session
+from torchvision.io import ImageReadMode, decode_jpeg
+from torchvision.transforms.v2 import InterpolationMode
+from torchvision.transforms.v2 import functional as TF
+from artsearch.src.utils.session_config import (
+    get_configured_session,
+    get_shared_session,
+)
+from artsearch.src.utils.embedding_cache import (
+    get_cached_embedding,
+    set_cached_embedding,
+)
 from artsearch.src.config import ClipSelection
 from artsearch.src.config import config
 
+logger = logging.getLogger(__name__)
+
+# Concurrent thumbnail downloads in the batch embedding pipeline
+DOWNLOAD_WORKERS = 16
+# Normalization constants used by clip.load's preprocess transform
+CLIP_MEAN = (0.48145466, 0.4578275, 0.40821073)
+CLIP_STD = (0.26862954, 0.26130258, 0.27577711)
+JPEG_MAGIC = b"\xff\xd8"
+
+
+def _is_gpu_decodable(image_bytes: bytes) -> bool:
+    """
+    Whether nvJPEG can decode the image: an RGB or grayscale JPEG.
+
+    Only the headers are parsed, so CMYK/YCCK JPEGs (and anything that is not
+    a JPEG) are routed to Pillow before they can fail a whole GPU batch.
+    """
+    if not image_bytes.startswith(JPEG_MAGIC):
+        return False
+    try:
+        with Image.open(BytesIO(image_bytes)) as img:
+            return img.mode in ("RGB", "L")
+    except (UnidentifiedImageError, OSError):
+        return False
+
 
 class ImageDownloadError(Exception):
     """Custom exception for image download failures."""
@@ -18,18 +56,11 @@ class ImageDownloadError(Exception):
 
 
 class CLIPEmbedder:
-    """A class for generating image embeddings using OpenAI's CLIP model."""
-
-    _instantiated = False
+    """
+    A class for generating image embeddings using OpenAI's CLIP model.
 
-    def __new__(cls, *args, **kwargs):
-        """Ensure that only one instance of CLIPEmbedder is created."""
-        if cls._instantiated:
-            raise RuntimeError(
-                "Use get_clip_embedder() instead of creating CLIPEmbedder directly."
-            )
-        cls._instantiated = True
-        return super().__new__(cls)
+    Use get_clip_embedder() to get the shared instance (one per worker).
+    """
 
     def __init__(
         self,
@@ -51,37 +82,222 @@ class CLIPEmbedder:
         self.device = device or config.device
         self.model, self.preprocess = self._load_model(model_name, self.device)
         self.embedding_dim = self.model.visual.proj.shape[1]
-        self.http_session = http_session or get_configured_session()
+        # Sized for the download threads in generate_thumbnail_embeddings
+        self.http_session = http_session or get_configured_session(
+            pool_maxsize=DOWNLOAD_WORKERS
+        )
+        # Reused page-locked staging buffer for host-to-GPU batch copies
+        self._pinned_buffer: torch.Tensor | None = None
+        # Decode and preprocess JPEGs on the GPU instead of with Pillow
+        self.gpu_preprocess = config.clip_gpu_preprocess and self.device.startswith(
+            "cuda"
+        )
+        self._warmup()
 
     def _load_model(self, model_name: str, device: str) -> Tuple[Any, Any]:
         """Load the CLIP model and preprocessor (caches model by default)."""
         start_time = time.time()
-        print(f"Loading CLIP model: {model_name}")
+        logger.info(f"Loading CLIP model: {model_name}")
         model, preprocess = clip.load(model_name, device=device)
-        print(f"Model loaded on in {time.time() - start_time:.2f}s")
+        logger.info(f"Model loaded on {device} in {time.time() - start_time:.2f}s")
+        if config.clip_torch_compile and device.startswith("cuda"):
+            # Compiled lazily on first forward pass (i.e. during warmup)
+            model.visual = torch.compile(model.visual, mode="reduce-overhead")
+            model.transformer = torch.compile(model.transformer, mode="reduce-overhead")
+            logger.info("Enabled torch.compile for CLIP image and text encoders")
         return model, preprocess
 
-    def _download_image(self, url: str) -> Image.Image:
-        """Download an image from a URL.
-        Raises an exception if the request fails or the image cannot be processed.
+    def _warmup(self) -> None:
+        """
+        Run one dummy image and text forward pass so CUDA context creation,
+        kernel selection and allocator warmup don't land on the first query.
+        """
+        start_time = time.time()
+        if self.device.startswith("cuda"):
+            torch.backends.cudnn.benchmark = True
+        size = self.model.visual.input_resolution
+        dtype = next(self.model.parameters()).dtype
+        with torch.inference_mode():
+            self.model.encode_image(
+                torch.zeros(1, 3, size, size, device=self.device, dtype=dtype)
+            )
+            self.model.encode_text(clip.tokenize(["warmup"]).to(self.device))
+        logger.info(f"Model warmed up in {time.time() - start_time:.2f}s")
+
+    def _download_image_bytes(self, url: str) -> bytes:
+        """Download raw image bytes from a URL.
+        Raises ImageDownloadError if the request fails or the body is empty.
         """
         try:
-            response = get_image_response(url)
+            response = self.http_session.get(url, timeout=10)
             response.raise_for_status()
-
-            if not response.content:  # Handle empty responses
-                raise ImageDownloadError(f"Empty response from URL: {url}")
-
-            image_bytes = response.content
-
-            return Image.open(BytesIO(image_bytes)).convert("RGB")
-
         except requests.RequestException as e:
             raise ImageDownloadError(f"Error downloading image from {url}: {e}")
 
+        if not response.content:  # Handle empty responses
+            raise ImageDownloadError(f"Empty response from URL: {url}")
+        return response.content
+
+    def _decode_image(self, image_bytes: bytes, url: str) -> Image.Image:
+        """Decode image bytes with Pillow into an RGB image.
+        Raises ImageDownloadError if the image cannot be processed.
+        """
+        try:
+            img = Image.open(BytesIO(image_bytes))
+            # Let libjpeg decode at a reduced scale (no-op for other formats).
+            # draft keeps both sides >= the requested size, so CLIP's own
+            # resize + center crop still has enough pixels.
+            size = self.model.visual.input_resolution
+            img.draft("RGB", (size, size))
+            return img.convert("RGB")
+
         except (UnidentifiedImageError, OSError, ValueError) as e:
             raise ImageDownloadError(f"Invalid or corrupted image from {url}: {e}")
 
+    def _load_image_tensor(self, url: str) -> torch.Tensor:
+        """
+        Download an image and apply CLIP preprocessing (CPU tensor).
+
+        With GPU preprocessing enabled, RGB and grayscale JPEGs are instead
+        returned as a 1-D uint8 tensor of the encoded bytes; _encode_images
+        decodes them on the GPU. Other images still go through Pillow.
+        """
+        image_bytes = self._download_image_bytes(url)
+        if self.gpu_preprocess and _is_gpu_decodable(image_bytes):
+            return torch.frombuffer(bytearray(image_bytes), dtype=torch.uint8)
+        return self.preprocess(self._decode_image(image_bytes, url))
+
+    def _decode_jpegs_on_gpu(
+        self, jpegs: list[torch.Tensor]
+    ) -> list[torch.Tensor | None]:
+        """
+        Decode encoded JPEGs with nvJPEG in one call.
+
+        nvJPEG fails the whole call if any image is corrupt or unsupported,
+        so on failure the images are decoded one at a time and those that
+        still fail are returned as None.
+        """
+        try:
+            return list(decode_jpeg(jpegs, mode=ImageReadMode.RGB, device=self.device))
+        except RuntimeError as e:
+            logger.warning(f"Batched GPU JPEG decode failed, retrying per image: {e}")
+
+        decoded: list[torch.Tensor | None] = []
+        for jpeg in jpegs:
+            try:
+                decoded.append(
+                    decode_jpeg(jpeg, mode=ImageReadMode.RGB, device=self.device)
+                )
+            except RuntimeError:
+                decoded.append(None)
+        return decoded
+
+    def _preprocess_on_gpu(
+        self, image_tensors: list[torch.Tensor]
+    ) -> tuple[torch.Tensor | None, list[int]]:
+        """
+        Build a batch on the GPU from a mix of encoded JPEGs (1-D uint8) and
+        already preprocessed CPU tensors.
+
+        JPEGs are decoded with nvJPEG and resized, cropped and normalized like
+        CLIP's own preprocess, so only the compressed bytes cross the bus.
+        Results can differ slightly from Pillow's decoder and resampling.
+        A JPEG that nvJPEG cannot decode is decoded with Pillow instead, and
+        one that Pillow cannot decode either is left out of the batch.
+
+        Returns:
+            The batch (None if no image could be decoded) and the positions
+            in image_tensors that it holds, in order.
+        """
+        size = self.model.visual.input_resolution
+        batch: list[torch.Tensor | None] = [
+            None if tensor.dim() == 1 else tensor.to(self.device, non_blocking=True)
+            for tensor in image_tensors
+        ]
+        jpeg_positions = [i for i, tensor in enumerate(batch) if tensor is None]
+        if jpeg_positions:
+            decoded = self._decode_jpegs_on_gpu(
+                [image_tensors[i] for i in jpeg_positions]
+            )
+            for position, image in zip(jpeg_positions, decoded):
+                if image is None:
+                    batch[position] = self._preprocess_with_pillow(
+                        image_tensors[position]
+                    )
+                    continue
+                image = TF.resize(
+                    image.float() / 255,
+                    [size],
+                    interpolation=InterpolationMode.BICUBIC,
+                    antialias=True,
+                )
+                image = TF.center_crop(image, [size, size])
+                batch[position] = TF.normalize(image, CLIP_MEAN, CLIP_STD)
+
+        positions = [i for i, tensor in enumerate(batch) if tensor is not None]
+        images = [tensor for tensor in batch if tensor is not None]
+        if not images:
+            return None, positions
+        return torch.stack(images), positions
+
+    def _preprocess_with_pillow(self, jpeg: torch.Tensor) -> torch.Tensor | None:
+        """CPU fallback for a JPEG nvJPEG rejected; None if Pillow fails too."""
+        try:
+            image = self._decode_image(jpeg.numpy().tobytes(), "GPU decode fallback")
+        except ImageDownloadError as e:
+            logger.warning(f"Skipping image in batch: {e}")
+            return None
+        return self.preprocess(image).to(self.device, non_blocking=True)
+
+    def _stack_to_device(self, image_tensors: list[torch.Tensor]) -> torch.Tensor:
+        """
+        Stack preprocessed images into a batch on the model's device.
+
+        On CUDA the batch is stacked into a pinned host buffer that is reused
+        across calls, so the copy to the GPU is a single async DMA transfer
+        and page-locked memory is not allocated per batch. The buffer is safe
+        to reuse because each encode ends with a synchronizing .cpu().
+        """
+        if not self.device.startswith("cuda"):
+            return torch.stack(image_tensors)
+
+        shape = (len(image_tensors), *image_tensors[0].shape)
+        buffer = self._pinned_buffer
+        if (
+            buffer is None
+            or buffer.shape[0] < shape[0]
+            or buffer.shape[1:] != shape[1:]
+        ):
+            buffer = torch.empty(shape, dtype=image_tensors[0].dtype, pin_memory=True)
+            self._pinned_buffer = buffer
+        staging = buffer[: shape[0]]
+        torch.stack(image_tensors, out=staging)
+        return staging.to(self.device, non_blocking=True)
+
+    def _encode_images(
+        self, image_tensors: list[torch.Tensor]
+    ) -> list[list[float] | None]:
+        """
+        Encode preprocessed images with CLIP in a single forward pass.
+
+        Returns one embedding per input, None for an image that could not be
+        decoded on the GPU path.
+        """
+        if self.gpu_preprocess:
+            batch, positions = self._preprocess_on_gpu(image_tensors)
+        else:
+            batch = self._stack_to_device(image_tensors)
+            positions = list(range(len(image_tensors)))
+        embeddings: list[list[float] | None] = [None] * len(image_tensors)
+        if batch is None:
+            return embeddings
+        with torch.inference_mode():
+            # Cast fp16 (CUDA) outputs back to fp32 before leaving the GPU
+            encoded = self.model.encode_image(batch).float().cpu()
+        for position, embedding in zip(positions, encoded.tolist()):
+            embeddings[position] = embedding
+        return embeddings
+
     def generate_thumbnail_embedding(
         self,
         thumbnail_url: str,
@@ -97,17 +313,80 @@ class CLIPEmbedder:
             list[float]: The embedding vector as a list, or None if an error occurs.
         """
         try:
-            img = self._download_image(thumbnail_url)
-            image_tensor = self.preprocess(img).unsqueeze(0).to(self.device)
-            with torch.no_grad():
-                embedding = (
-                    self.model.encode_image(image_tensor).cpu().numpy().flatten()
-                )
-            return embedding.tolist()
+            return self._encode_images([self._load_image_tensor(thumbnail_url)])[0]
         except Exception as e:
-            print(f"Error generating embedding for object {object_number}: {e}")
+            logger.warning(
+                f"Error generating embedding for object {object_number}: {e}"
+            )
             return None
 
+    def generate_thumbnail_embeddings(
+        self,
+        items: Iterable[tuple[str, str]],
+        batch_size: int = 32,
+        max_workers: int = DOWNLOAD_WORKERS,
+    ) -> Iterator[tuple[str, list[float] | None]]:
+        """
+        Generate image embeddings for many thumbnails, overlapping downloads
+        with batched encoding.
+
+        A thread pool downloads and preprocesses images while the calling
+        thread encodes them batch_size at a time in one forward pass, so the
+        GPU is not run on batches of one. At most max_workers + batch_size
+        images are in flight, which bounds memory use.
+
+        Args:
+            items: Iterable of (thumbnail_url, object_number) tuples.
+            batch_size: Number of images per encode_image call.
+            max_workers: Number of concurrent image downloads.
+        Yields:
+            (object_number, embedding) tuples in input order; embedding is None
+            if the download or encoding failed.
+        """
+        items_iter = iter(items)
+        pending: deque[tuple[str, Future[torch.Tensor]]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def submit_next() -> None:
+                item = next(items_iter, None)
+                if item is not None:
+                    thumbnail_url, object_number = item
+                    future = executor.submit(self._load_image_tensor, thumbnail_url)
+                    pending.append((object_number, future))
+
+            for _ in range(max_workers + batch_size):
+                submit_next()
+
+            while pending:
+                # Collect the next batch in input order, skipping failed downloads
+                object_numbers: list[str] = []
+                tensors: list[torch.Tensor] = []
+                loaded: list[int] = []  # batch positions with a tensor
+                while pending and len(object_numbers) < batch_size:
+                    object_number, future = pending.popleft()
+                    submit_next()
+                    try:
+                        tensors.append(future.result())
+                        loaded.append(len(object_numbers))
+                    except Exception as e:
+                        logger.warning(
+                            f"Error generating embedding for object "
+                            f"{object_number}: {e}"
+                        )
+                    object_numbers.append(object_number)
+
+                embeddings: list[list[float] | None] = [None] * len(object_numbers)
+                if tensors:
+                    try:
+                        for position, embedding in zip(
+                            loaded, self._encode_images(tensors)
+                        ):
+                            embeddings[position] = embedding
+                    except Exception as e:
+                        logger.warning(f"Error encoding batch of images: {e}")
+
+                yield from zip(object_numbers, embeddings)
+
     def generate_text_embedding(self, query: str) -> list[float]:
         """
         Generate a text embedding from a given query string.
@@ -118,13 +397,18 @@ class CLIPEmbedder:
         Returns:
             list[float]: The text embedding as a list.
         """
-        return _generate_text_embedding_cached(self.model, self.device, query)
+        return _generate_text_embedding_cached(
+            self.model, self.device, self.model_name, normalize_query(query)
+        )
 
 
 # Maxsize is set to 50 to cache the most common queries
 # Should be at least 1 to cache the item in question on infinite scroll
+# Misses fall through to the persistent embedding cache before running CLIP
 @lru_cache(maxsize=50)
-def _generate_text_embedding_cached(model: Any, device: str, query: str) -> list[float]:
+def _generate_text_embedding_cached(
+    model: Any, device: str, model_name: str, query: str
+) -> list[float]:
     """
     Pure function for generating text embeddings with LRU caching.
 
@@ -134,19 +418,46 @@ def _generate_text_embedding_cached(model: Any, device: str, query: str) -> list
     Args:
         model: The CLIP model instance.
         device (str): Device to run the model on ("cuda" or "cpu").
+        model_name (str): Name of the CLIP model, used as persistent cache key.
         query (str): The input text to encode.
 
     Returns:
         list[float]: The text embedding as a list.
     """
-    text = clip.tokenize([query]).to(device)
-    with torch.no_grad():
-        return model.encode_text(text).cpu().numpy().flatten().tolist()
+    cached = get_cached_embedding(model_name, query)
+    if cached is not None:
+        return cached
+
+    text = _tokenize_cached(query, device)
+    with torch.inference_mode():
+        embedding = model.encode_text(text)[0].float().cpu().tolist()
+    set_cached_embedding(model_name, query, embedding)
+    return embedding
+
+
+def normalize_query(query: str) -> str:
+    """
+    Lowercase and collapse whitespace so equivalent queries share cache entries.
+
+    CLIP's tokenizer lowercases and cleans whitespace itself, so this never
+    changes the resulting embedding.
+    """
+    return " ".join(query.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_cached(query: str, device: str) -> torch.Tensor:
+    """
+    Tokenize a query once (BPE + tensor build) and keep the token tensor on
+    the model's device, so repeats skip the host-to-device copy too.
+    Each entry is 77 int64s, so the cache stays well under 1 MB.
+    """
+    return clip.tokenize([query]).to(device)
 
 
 @lru_cache(maxsize=1)
 def get_image_response(url: str) -> requests.Response:
-    response = requests.get(url, timeout=10)
+    response = get_shared_session().get(url, timeout=10)
     return response
 
 
@@ -1,31 +1,81 @@
+import logging
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from artsearch.src.config import config
+from artsearch.src.utils.embedding_cache import (
+    get_cached_embedding,
+    set_cached_embedding,
+)
+from artsearch.src.utils.session_config import get_configured_session
 
 JINA_API_URL = "https://api.jina.ai/v1/embeddings"
 JINA_MODEL = "jina-clip-v2"
 JINA_DIMENSIONS = 256
+JINA_BATCH_SIZE = 32  # Inputs per request for batch embedding
+# Persistent cache namespace; includes dimensions since they change the vector
+JINA_CACHE_MODEL_KEY = f"{JINA_MODEL}:{JINA_DIMENSIONS}"
 
+logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=50)
-def _cached_jina_text_embedding(query: str) -> tuple[float, ...]:
-    """Cache wrapper - returns tuple for hashability."""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.jina_api_key}",
-    }
-    response = requests.post(
-        JINA_API_URL,
-        headers=headers,
-        json={
-            "input": [{"text": query}],
-            "model": JINA_MODEL,
-            "dimensions": JINA_DIMENSIONS,
-        },
-        timeout=10,
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {config.jina_api_key}",
+}
+# Invariant tail of the request body, serialized once: b'"model":...,"dimensions":...}'
+_BODY_TAIL = orjson.dumps({"model": JINA_MODEL, "dimensions": JINA_DIMENSIONS})[1:]
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Shared session so repeated calls reuse the TCP/TLS connection to Jina."""
+    return get_configured_session(retry_post=True)
+
+
+def _post_embeddings(inputs: list[dict], timeout: int) -> list[list[float]]:
+    """
+    POST inputs to the Jina embeddings API; returns embeddings in input order.
+
+    Raises ValueError unless the response holds exactly one embedding per
+    input, so a short or partial response can never shift vectors onto the
+    wrong inputs.
+    """
+    body = b'{"input":' + orjson.dumps(inputs) + b"," + _BODY_TAIL
+    response = _get_session().post(
+        JINA_API_URL, headers=_HEADERS, data=body, timeout=timeout
     )
     response.raise_for_status()
-    return tuple(response.json()["data"][0]["embedding"])
+    data = orjson.loads(response.content)["data"]
+
+    embeddings: list[list[float] | None] = [None] * len(inputs)
+    for item in data:
+        index = item["index"]
+        if not 0 <= index < len(inputs) or embeddings[index] is not None:
+            raise ValueError(f"Jina returned an unexpected index {index}")
+        embeddings[index] = item["embedding"]
+    if len(data) != len(inputs):
+        raise ValueError(
+            f"Jina returned {len(data)} embeddings for {len(inputs)} inputs"
+        )
+    return embeddings  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=50)
+def _cached_jina_text_embedding(query: str) -> tuple[float, ...]:
+    """
+    Cache wrapper - returns tuple for hashability.
+
+    Misses fall through to the persistent embedding cache before calling
+    the (paid) Jina API.
+    """
+    cached = get_cached_embedding(JINA_CACHE_MODEL_KEY, query)
+    if cached is not None:
+        return tuple(cached)
+
+    embedding = _post_embeddings([{"text": query}], timeout=10)[0]
+    set_cached_embedding(JINA_CACHE_MODEL_KEY, query, embedding)
+    return tuple(embedding)
 
 
 class JinaEmbedder:
@@ -43,22 +93,53 @@ class JinaEmbedder:
         (Jan 2025), so any change requires re-embedding everything for consistency.
         See .claude/rules/etl-pipeline.md for full context.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {config.jina_api_key}",
-        }
-        response = requests.post(
-            JINA_API_URL,
-            headers=headers,
-            json={
-                "input": [{"image": image_url}],
-                "model": JINA_MODEL,
-                "dimensions": JINA_DIMENSIONS,
-            },
-            timeout=30,
+        return _post_embeddings([{"image": image_url}], timeout=30)[0]
+
+    def generate_text_embeddings_batch(
+        self, texts: list[str], batch_size: int = JINA_BATCH_SIZE, max_workers: int = 4
+    ) -> list[list[float] | None]:
+        """
+        Generate text embeddings with one API request per batch_size texts.
+        Returns embeddings in input order; None for items in a failed request.
+        """
+        return self._embed_batches(
+            [{"text": text} for text in texts], batch_size, max_workers, timeout=30
         )
-        response.raise_for_status()
-        return response.json()["data"][0]["embedding"]
+
+    def generate_image_embeddings_batch(
+        self,
+        image_urls: list[str],
+        batch_size: int = JINA_BATCH_SIZE,
+        max_workers: int = 4,
+    ) -> list[list[float] | None]:
+        """
+        Generate image embeddings with one API request per batch_size URLs.
+        Returns embeddings in input order; None for items in a failed request.
+        """
+        return self._embed_batches(
+            [{"image": url} for url in image_urls], batch_size, max_workers, timeout=120
+        )
+
+    def _embed_batches(
+        self, inputs: list[dict], batch_size: int, max_workers: int, timeout: int
+    ) -> list[list[float] | None]:
+        """Send inputs in chunks, up to max_workers requests in flight."""
+        chunks = [
+            inputs[i : i + batch_size] for i in range(0, len(inputs), batch_size)
+        ]
+
+        def embed_chunk(chunk: list[dict]) -> list[list[float]] | list[None]:
+            try:
+                return _post_embeddings(chunk, timeout=timeout)
+            except Exception as e:
+                logger.warning(f"Jina batch of {len(chunk)} inputs failed: {e}")
+                return [None] * len(chunk)
+
+        embeddings: list[list[float] | None] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_embeddings in executor.map(embed_chunk, chunks):
+                embeddings.extend(chunk_embeddings)
+        return embeddings
 
 
 @lru_cache(maxsize=1)
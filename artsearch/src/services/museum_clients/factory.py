@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from artsearch.src.services.museum_clients.smk_api_client import SMKAPIClient
 from artsearch.src.services.museum_clients.cma_api_client import CMAAPIClient
 from artsearch.src.services.museum_clients.rma_api_client import RMAAPIClient
@@ -14,7 +16,9 @@ CLIENTS = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_museum_client(museum_name: str) -> MuseumAPIClient:
+    """Return the shared (stateless) client instance for a museum."""
     client_class = CLIENTS.get(museum_name)
     if not client_class:
         raise ValueError(f"Unknown museum client: {museum_name}")
@@ -2,6 +2,8 @@
 Service to aggregate artwork statistics per museum and work type.
 Correctly handles artworks with multiple work types (no double-counting)
 LRU cache can be reset using /clear-cache/ endpoint.
+Callers pass filters as sorted tuples, so the same selection shares one cache
+entry regardless of the order it arrived in.
 """
 
 import time
@@ -9,9 +11,10 @@ import logging
 from functools import lru_cache
 from dataclasses import dataclass
 from django.db import connection
-from django.db.models import Count
-from artsearch.models import ArtworkStats
 from artsearch.src.cache_registry import register_cache
+from artsearch.src.constants.search import DEFAULT_WORK_TYPE_FILTER
+from artsearch.src.constants.work_types import SEARCHABLE_WORK_TYPES
+from artsearch.src.utils.get_museums import get_museum_slugs
 
 logger = logging.getLogger(__name__)
 
@@ -38,70 +41,80 @@ def aggregate_work_type_count_for_selected_museums(
     Used every time the work type filter dropdown is created or updated (based on selected museums).
 
     Args:
-        selected_museums: Tuple of museum slugs to filter by (must be tuple for caching)
+        selected_museums: Tuple of museum slugs to filter by (sorted tuple for caching)
 
     Returns:
         MuseumWorkTypeSummary with work_types dict and total count
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(
         f"[CACHE] aggregate_work_type_count called with museums: {selected_museums}"
     )
 
-    # Use PostgreSQL's jsonb_array_elements_text to unnest work types at database level
-    # This is 100x faster than fetching all rows and looping in Python
-    query_start = time.time()
+    # Use PostgreSQL's unnest to expand work types at database level
+    # This is 100x faster than fetching all rows and looping in Python.
+    # The total number of artworks comes back in the same round trip, as the
+    # row with a NULL work type.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        query_start = time.perf_counter()
     with connection.cursor() as cursor:
         cursor.execute(
             """
-            SELECT
-                work_type,
-                COUNT(*) as count
-            FROM
-                artsearch_artworkstats,
-                jsonb_array_elements_text(searchable_work_types) as work_type
-            WHERE
-                museum_slug = ANY(%s)
-            GROUP BY work_type
-            ORDER BY count DESC
+            WITH base AS (
+                SELECT searchable_work_types
+                FROM artsearch_artworkstats
+                WHERE museum_slug = ANY(%s)
+            )
+            SELECT work_type, count
+            FROM (
+                SELECT NULL AS work_type, COUNT(*) AS count FROM base
+                UNION ALL
+                SELECT
+                    work_type,
+                    COUNT(*) as count
+                FROM
+                    base,
+                    unnest(base.searchable_work_types) as work_type
+                GROUP BY work_type
+            ) AS counts
+            -- A UNION's ORDER BY only accepts output column names, so the
+            -- expression sort is applied to the derived table instead
+            ORDER BY work_type IS NOT NULL, count DESC, work_type
             """,
             [[museum for museum in selected_museums]],
         )
 
-        work_type_counts = {row[0]: row[1] for row in cursor.fetchall()}
-    logger.info(
-        f"[TIMING] aggregate_work_type_count - Database GROUP BY: {(time.time() - query_start) * 1000:.2f}ms"
-    )
+        total = 0
+        work_type_counts = {}
+        for work_type, count in cursor:
+            if work_type is None:
+                total = count
+            else:
+                work_type_counts[work_type] = count
+    if debug:
+        logger.debug(
+            f"[TIMING] aggregate_work_type_count - Database query: {(time.perf_counter() - query_start) * 1000:.2f}ms"
+        )
+        get_names_start = time.perf_counter()
 
-    # Ensure all known work types are included (even with 0 count)
-    get_names_start = time.time()
+    # Ensure all known work types are included (even with 0 count). Rows arrive
+    # sorted by count descending, so appending the zero counts keeps the order.
     all_work_types = get_work_type_names()
-    logger.info(
-        f"[TIMING] aggregate_work_type_count - get_work_type_names: {(time.time() - get_names_start) * 1000:.2f}ms"
-    )
+    if debug:
+        logger.debug(
+            f"[TIMING] aggregate_work_type_count - get_work_type_names: {(time.perf_counter() - get_names_start) * 1000:.2f}ms"
+        )
 
     for work_type in all_work_types:
-        if work_type not in work_type_counts:
-            work_type_counts[work_type] = 0
-
-    # Sort by count descending
-    sorted_work_types = dict(
-        sorted(work_type_counts.items(), key=lambda x: x[1], reverse=True)
-    )
-
-    # Total unique artworks
-    count_start = time.time()
-    total = ArtworkStats.objects.filter(museum_slug__in=selected_museums).count()
-    logger.info(
-        f"[TIMING] aggregate_work_type_count - COUNT query: {(time.time() - count_start) * 1000:.2f}ms"
-    )
+        work_type_counts.setdefault(work_type, 0)
 
-    elapsed = (time.time() - start_time) * 1000
+    elapsed = (time.perf_counter() - start_time) * 1000
     logger.info(
         f"[TIMING] aggregate_work_type_count_for_selected_museums - TOTAL: {elapsed:.2f}ms"
     )
 
-    return MuseumWorkTypeSummary(work_types=sorted_work_types, total=total)
+    return MuseumWorkTypeSummary(work_types=work_type_counts, total=total)
 
 
 @register_cache
@@ -117,12 +130,12 @@ def aggregate_museum_count_for_selected_work_types(
     Used every time the museum filter dropdown is created or updated.
 
     Args:
-        selected_work_types: Tuple of work type names to filter by (must be tuple for caching)
+        selected_work_types: Tuple of work type names to filter by (sorted tuple for caching)
 
     Returns:
         MuseumWorkTypeSummary with museums as keys and their artwork counts
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(
         f"[CACHE] aggregate_museum_count called with {len(selected_work_types)} work types"
     )
@@ -130,28 +143,33 @@ def aggregate_museum_count_for_selected_work_types(
     selected_work_types_list = list(selected_work_types)
 
     # Filter artworks that have at least one of the selected work types
-    # Use PostgreSQL's ?| operator for efficient array overlap check (single index lookup)
-    query_build_start = time.time()
-    logger.info(
-        f"[TIMING] aggregate_museum_count - Query build: {(time.time() - query_build_start) * 1000:.2f}ms"
-    )
-
-    query_exec_start = time.time()
-    museum_counts = (
-        ArtworkStats.objects.extra(
-            where=["searchable_work_types ?| %s"], params=[selected_work_types_list]
+    # Use PostgreSQL's && operator for efficient array overlap check (single index lookup)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        query_exec_start = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT
+                museum_slug,
+                COUNT(*) as count
+            FROM
+                artsearch_artworkstats
+            WHERE
+                searchable_work_types && %s::text[]
+            GROUP BY museum_slug
+            ORDER BY count DESC
+            """,
+            [selected_work_types_list],
         )
-        .values("museum_slug")
-        .annotate(count=Count("id"))
-        .order_by("-count")
-    )
-    museums = {item["museum_slug"]: item["count"] for item in museum_counts}
+        museums = {row[0]: row[1] for row in cursor}
     total = sum(museums.values())
-    logger.info(
-        f"[TIMING] aggregate_museum_count - Query execution: {(time.time() - query_exec_start) * 1000:.2f}ms"
-    )
+    if debug:
+        logger.debug(
+            f"[TIMING] aggregate_museum_count - Query execution: {(time.perf_counter() - query_exec_start) * 1000:.2f}ms"
+        )
 
-    elapsed = (time.time() - start_time) * 1000
+    elapsed = (time.perf_counter() - start_time) * 1000
     logger.info(
         f"[TIMING] aggregate_museum_count_for_selected_work_types - TOTAL: {elapsed:.2f}ms"
     )
@@ -169,37 +187,40 @@ def get_total_works_for_filters(
     Used on every search, so must be fast.
 
     Args:
-        selected_museums: Tuple of museum slugs to filter by (must be tuple for caching)
-        selected_work_types: Tuple of work type names to filter by (must be tuple for caching)
+        selected_museums: Tuple of museum slugs to filter by (sorted tuple for caching)
+        selected_work_types: Tuple of work type names to filter by (sorted tuple for caching)
 
     Returns:
         Integer count of unique artworks matching both filters
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     logger.info(
         f"[CACHE] get_total_works called: {len(selected_museums)} museums, {len(selected_work_types)} work types"
     )
 
     # Build query for artworks matching museum filter AND at least one work type
-    # Use PostgreSQL's ?| operator for efficient array overlap check (single index lookup)
-    query_build_start = time.time()
-    logger.info(
-        f"[TIMING] get_total_works - Query build: {(time.time() - query_build_start) * 1000:.2f}ms"
-    )
-
-    count_start = time.time()
-    result = (
-        ArtworkStats.objects.filter(museum_slug__in=selected_museums)
-        .extra(
-            where=["searchable_work_types ?| %s"], params=[list(selected_work_types)]
+    # Use PostgreSQL's && operator for efficient array overlap check (single index lookup)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        count_start = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT COUNT(*)
+            FROM artsearch_artworkstats
+            WHERE
+                museum_slug = ANY(%s)
+                AND searchable_work_types && %s::text[]
+            """,
+            [list(selected_museums), list(selected_work_types)],
+        )
+        result = cursor.fetchone()[0]
+    if debug:
+        logger.debug(
+            f"[TIMING] get_total_works - COUNT query: {(time.perf_counter() - count_start) * 1000:.2f}ms"
         )
-        .count()
-    )
-    logger.info(
-        f"[TIMING] get_total_works - COUNT query: {(time.time() - count_start) * 1000:.2f}ms"
-    )
 
-    elapsed = (time.time() - start_time) * 1000
+    elapsed = (time.perf_counter() - start_time) * 1000
     logger.info(f"[TIMING] get_total_works_for_filters - TOTAL: {elapsed:.2f}ms")
 
     return result
@@ -211,32 +232,44 @@ def get_work_type_names() -> list[str]:
     """
     Returns all work types across all museums, sorted alphabetically.
 
-    Cached with LRU cache (maxsize=1) since work types are stable.
-    Cache is per-process and cleared on deployment/restart.
+    The ETL only ever tags artworks with SEARCHABLE_WORK_TYPES, so the names
+    come from that constant rather than from a DISTINCT query over the table.
+    Cached with LRU cache (maxsize=1) so callers share one list.
 
     Returns:
         Sorted list of all unique work type names
     """
-    start_time = time.time()
-
-    # Use PostgreSQL's jsonb_array_elements_text to get distinct work types at database level
-    # This is 100x faster than fetching all rows and looping in Python
-    with connection.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT DISTINCT work_type
-            FROM
-                artsearch_artworkstats,
-                jsonb_array_elements_text(searchable_work_types) as work_type
-            ORDER BY work_type
-            """
-        )
+    return sorted(SEARCHABLE_WORK_TYPES)
 
-        result = [row[0] for row in cursor.fetchall()]
 
-    elapsed = (time.time() - start_time) * 1000
-    logger.info(
-        f"[TIMING] get_work_type_names - TOTAL: {elapsed:.2f}ms (cached for subsequent calls)"
-    )
+def warm_stats_caches() -> None:
+    """
+    Populate the stats caches for the unfiltered landing page.
 
-    return result
+    Meant to run in a background thread when a worker boots, so the first
+    visitor does not pay for the cold queries. Uses the same arguments the
+    views pass when no filters are selected, so the cache keys match.
+    """
+    start_time = time.perf_counter()
+    try:
+        museums = tuple(sorted(get_museum_slugs()))
+        work_types = tuple(
+            sorted(
+                get_work_type_names()
+                if DEFAULT_WORK_TYPE_FILTER is None
+                else DEFAULT_WORK_TYPE_FILTER
+            )
+        )
+        aggregate_work_type_count_for_selected_museums(museums)
+        aggregate_museum_count_for_selected_work_types(work_types)
+        get_total_works_for_filters(museums, work_types)
+    except Exception:
+        logger.exception("Failed to warm stats caches")
+        return
+    finally:
+        # This runs outside the request cycle, so nothing else will close
+        # the thread's database connection
+        connection.close()
+
+    elapsed = (time.perf_counter() - start_time) * 1000
+    logger.info(f"[TIMING] warm_stats_caches - TOTAL: {elapsed:.2f}ms")
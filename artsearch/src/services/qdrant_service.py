@@ -6,6 +6,7 @@ import logging
 from qdrant_client import QdrantClient, models
 from qdrant_client.conversions.common_types import PointId
 from artsearch.src.utils.qdrant_formatting import (
+    FORMATTED_PAYLOAD_FIELDS,
     format_payloads,
     format_hits,
 )
@@ -17,6 +18,7 @@ from artsearch.src.constants.embedding_models import (
     MODEL_TO_VECTOR_NAME,
     ResolvedEmbeddingModel,
 )
+from etl.utils import generate_uuid5
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +57,7 @@ class QdrantService:
         with_vector: bool = False,
         with_payload: bool = False,
         limit: int = 1,
-    ) -> list[models.ScoredPoint]:
+    ) -> list[models.Record | models.ScoredPoint]:
         """
         Get items by object number.
         If museum is provided, it will filter by museum as well.
@@ -126,9 +128,9 @@ class QdrantService:
         # If speed becomes an issue, we can instead try
         # models.SearchParams(hnsw_ef=128) # Try 128, 256, or 512...
         # for a compromise between speed and recall.
-        # An index on work_types would speed up
-        # the payload filtering (happens before vector search),
-        # but seems not to be needed yet.
+        # The payload filtering (happens before vector search) is served by
+        # keyword indexes on museum, searchable_work_types and object_number,
+        # created by EmbeddingLoadService.
         search_params = models.SearchParams(exact=True)
 
         # Determine which vector to search based on embedding model
@@ -143,6 +145,7 @@ class QdrantService:
             query_filter=query_filter,
             search_params=search_params,
             using=vector_name,
+            with_payload=FORMATTED_PAYLOAD_FIELDS,
         )
         qdrant_time = (time.time() - qdrant_start) * 1000
 
@@ -315,7 +318,7 @@ class QdrantService:
         result = self.qdrant_client.query_points(
             collection_name=self.collection_name,
             query_filter=models.Filter(should=should_conditions),
-            with_payload=True,
+            with_payload=FORMATTED_PAYLOAD_FIELDS,
             limit=len(artwork_ids),
         )
 
@@ -391,35 +394,40 @@ def _get_items_by_object_number_cached(
     with_payload: bool = False,
     limit: int = 1,
     collection_name: str = config.qdrant_collection_name_app,
-) -> list[models.ScoredPoint]:
+) -> list[models.Record | models.ScoredPoint]:
     """
     Private cached function to fetch items by object number from Qdrant.
 
-    Returns list of ScoredPoint objects matching the object_number filter.
-    If object_museum is provided, also filters by museum.
+    Returns list of points matching the object_number filter.
+    If object_museum is provided, the point is looked up by its deterministic
+    id (see etl.utils.generate_uuid5), a single primary key lookup; a miss
+    means the artwork is not in the collection. Without a museum the
+    object_number payload is filtered instead.
 
     Results are cached based on all parameters.
     Called by QdrantService.get_items_by_object_number() instance method.
     """
     qdrant_client = get_qdrant_client()
-    conditions = []
-
-    conditions.append(
-        models.FieldCondition(
-            key="object_number", match=models.MatchValue(value=object_number)
-        )
-    )
 
     if object_museum is not None:
-        conditions.append(
-            models.FieldCondition(
-                key="museum", match=models.MatchValue(value=object_museum)
+        return list(
+            qdrant_client.retrieve(
+                collection_name=collection_name,
+                ids=[generate_uuid5(object_museum, object_number)],
+                with_payload=with_payload,
+                with_vectors=with_vector,
             )
         )
 
     result = qdrant_client.query_points(
         collection_name=collection_name,
-        query_filter=models.Filter(must=conditions),
+        query_filter=models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="object_number", match=models.MatchValue(value=object_number)
+                )
+            ]
+        ),
         with_payload=with_payload,
         with_vectors=with_vector,
         limit=limit,
@@ -1,5 +1,5 @@
 import traceback
-from typing import Iterable, TypedDict
+from typing import Collection, TypedDict
 from dataclasses import dataclass
 from artsearch.src.services.qdrant_service import (
     QdrantService,
@@ -98,14 +98,14 @@ def analyze_query(
 
 
 def make_prefilter(
-    all_items: Iterable[str],
+    all_items: Collection[str],
     selected_items: list[str],
 ) -> list[str] | None:
     """
     Generalized prefilter function for work types and museums.
     If all items are selected, or none are selected, return None.
     """
-    if not selected_items or len(selected_items) == len(list(all_items)):
+    if not selected_items or len(selected_items) == len(all_items):
         return None
     return selected_items
 
@@ -173,8 +173,8 @@ def handle_search(
     work_type_prefilter = make_prefilter(all_work_type_names, selected_work_types)
 
     total_works = get_total_works_for_filters(
-        tuple(selected_museums),
-        tuple(selected_work_types),
+        tuple(sorted(selected_museums)),
+        tuple(sorted(selected_work_types)),
     )
 
     if query is None or query == "":
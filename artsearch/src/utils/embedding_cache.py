@@ -0,0 +1,98 @@
+"""
+Persistent, content-addressed cache for query embeddings.
+
+Text embeddings are deterministic for a given model and query, so they can be
+shared between worker processes and survive restarts. Entries live in a small
+SQLite file and are keyed by a hash of the model name and the query text.
+Vectors are stored as float32 blobs.
+
+The cache is best effort: any SQLite error is logged and treated as a miss.
+It is off unless EMBEDDING_CACHE_PATH points at a file.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+from artsearch.src.config import config
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    return hashlib.blake2b(
+        f"{model_name}\x00{text}".encode(), digest_size=16
+    ).hexdigest()
+
+
+# Not in the cache registry: clear_all_caches() must not drop an open
+# connection, and persisted embeddings outlive the in-memory caches.
+@lru_cache(maxsize=1)
+def _get_connection() -> sqlite3.Connection | None:
+    if not config.embedding_cache_path:
+        return None
+    try:
+        path = Path(config.embedding_cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        conn.commit()
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Embedding cache disabled: {e}")
+        return None
+
+
+def close_connection() -> None:
+    """Close the SQLite connection, if open, so the next call reopens it."""
+    if _get_connection.cache_info().currsize:
+        conn = _get_connection()
+        if conn is not None:
+            conn.close()
+    _get_connection.cache_clear()
+
+
+def get_cached_embedding(model_name: str, text: str) -> list[float] | None:
+    """Return the cached embedding for (model_name, text), or None on a miss."""
+    conn = _get_connection()
+    if conn is None:
+        return None
+    key = make_cache_key(model_name, text)
+    try:
+        with _lock:
+            row = conn.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding cache read failed: {e}")
+        return None
+    if row is None:
+        return None
+    return array("f", row[0]).tolist()
+
+
+def set_cached_embedding(model_name: str, text: str, embedding: list[float]) -> None:
+    """Store an embedding for (model_name, text)."""
+    conn = _get_connection()
+    if conn is None:
+        return
+    key = make_cache_key(model_name, text)
+    try:
+        with _lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                (key, array("f", embedding).tobytes()),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding cache write failed: {e}")
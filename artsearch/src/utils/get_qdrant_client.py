@@ -17,7 +17,8 @@ def get_qdrant_client():
     - The client manages its own connection pool with automatic reconnection
 
     Connection lifecycle:
-    - The cached client holds a connection pool (managed by HTTPX internally)
+    - The cached client holds a connection pool (managed by HTTPX internally,
+      or a gRPC channel when QDRANT_PREFER_GRPC is set)
     - Stale/dead connections are automatically detected and replaced
     - Connection failures raise exceptions that are caught by error handlers
     - No manual cleanup needed - connections managed automatically
@@ -28,4 +29,8 @@ def get_qdrant_client():
 
     See: https://qdrant.tech/documentation/guides/distributed-deployment/#client-configuration
     """
-    return QdrantClient(url=config.qdrant_url, api_key=config.qdrant_api_key)
+    return QdrantClient(
+        url=config.qdrant_url,
+        api_key=config.qdrant_api_key,
+        prefer_grpc=config.qdrant_prefer_grpc,
+    )
@@ -1,5 +1,7 @@
 """Helper functions to format downloaded Qdrant payloads for frontend display."""
 
+from functools import lru_cache
+
 from qdrant_client import models
 
 from artsearch.src.constants.museums import SUPPORTED_MUSEUMS
@@ -10,15 +12,34 @@ from artsearch.src.services.museum_clients.utils import (
 )
 from etl.services.bucket_service import get_bucket_image_url
 
+# Payload fields read by format_payload. Search queries request only these,
+# so Qdrant does not ship (and the client does not parse) the rest.
+FORMATTED_PAYLOAD_FIELDS = [
+    "title",
+    "artists",
+    "work_types",
+    "production_date",
+    "museum",
+    "object_number",
+    "museum_db_id",
+]
+
+_MUSEUM_FULL_NAMES = {
+    museum["slug"]: museum["full_name"] for museum in SUPPORTED_MUSEUMS
+}
+
 
 def get_full_museum_name(museum_slug: str) -> str:
     """
     Get full museum name from slug.
     """
-    for museum in SUPPORTED_MUSEUMS:
-        if museum["slug"] == museum_slug.lower():
-            return museum["full_name"]
-    return museum_slug
+    return _MUSEUM_FULL_NAMES.get(museum_slug.lower(), museum_slug)
+
+
+@lru_cache(maxsize=1024)
+def _display_work_type(work_type: str) -> str:
+    """Standardized, capitalized work type. The vocabulary is small, so cache it."""
+    return get_standardized_work_type(work_type).capitalize()
 
 
 def format_payload(payload: models.Payload | None) -> dict:
@@ -29,37 +50,32 @@ def format_payload(payload: models.Payload | None) -> dict:
         raise ValueError("Payload cannot be None")
 
     production_date = payload.get("production_date", "")
+    museum = payload["museum"]
+    object_number = payload["object_number"]
+    museum_db_id = payload["museum_db_id"]
 
-    work_types = [
-        get_standardized_work_type(name).capitalize() for name in payload["work_types"]
-    ]
+    work_types = [_display_work_type(name) for name in payload["work_types"]]
 
     artists_list = payload.get("artists", [])
     artist_display = ", ".join(filter(None, artists_list)) or "Unknown Artist"
 
-    thumbnail_url = get_bucket_image_url(
-        payload["museum"], payload["object_number"], use_etl_bucket=False
-    )
+    thumbnail_url = get_bucket_image_url(museum, object_number, use_etl_bucket=False)
 
-    source_url = get_museum_page_url(
-        payload["museum"], payload["object_number"], payload["museum_db_id"]
-    )
-    api_url = get_museum_api_url(
-        payload["museum"], payload["object_number"], payload["museum_db_id"]
-    )
+    source_url = get_museum_page_url(museum, object_number, museum_db_id)
+    api_url = get_museum_api_url(museum, object_number, museum_db_id)
     return {
         "title": payload["title"],
         "artist": artist_display,
         "work_types": work_types,
         "thumbnail_url": thumbnail_url,
         "production_date": production_date,
-        "object_number": payload["object_number"],
-        "museum": get_full_museum_name(payload["museum"]),
-        "museum_slug": payload["museum"],
-        "museum_db_id": payload["museum_db_id"],
+        "object_number": object_number,
+        "museum": get_full_museum_name(museum),
+        "museum_slug": museum,
+        "museum_db_id": museum_db_id,
         "source_url": source_url,
         "api_url": api_url,
-        "find_similar_query": f"{payload['museum']}:{payload['object_number']}",
+        "find_similar_query": f"{museum}:{object_number}",
     }
 
 
@@ -69,7 +85,7 @@ def format_payloads(payloads: list[models.Payload | None]) -> list[dict]:
 
 def format_hit(hit: models.ScoredPoint) -> dict:
     formatted_hit = format_payload(hit.payload)
-    formatted_hit.update({"score": round(hit.score, 3)})
+    formatted_hit["score"] = round(hit.score, 3)
     return formatted_hit
 
 
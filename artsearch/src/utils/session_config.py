@@ -1,14 +1,42 @@
+from functools import lru_cache
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 
-def get_configured_session() -> requests.Session:
-    """Return a requests.Session object with retries configured."""
+def get_configured_session(
+    retry_post: bool = False, pool_maxsize: int = 10
+) -> requests.Session:
+    """
+    Return a requests.Session object with retries configured.
+
+    Args:
+        retry_post: Also retry POST requests. Only use for idempotent POST APIs
+            (e.g. embedding endpoints); urllib3 skips POST retries by default.
+        pool_maxsize: Keep-alive connections per host. Should be at least the
+            number of threads sharing the session.
+    """
     session = requests.Session()
+    allowed_methods = Retry.DEFAULT_ALLOWED_METHODS
+    if retry_post:
+        allowed_methods = allowed_methods | {"POST"}
     retry_strategy = Retry(
-        total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504]
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=allowed_methods,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
     session.mount("https://", adapter)
     return session
+
+
+@lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """
+    Return a process-wide session for one-shot museum API requests, so
+    keep-alive connections are reused across calls instead of opening a new
+    pool (and TLS handshake) each time.
+    """
+    return get_configured_session(pool_maxsize=32)
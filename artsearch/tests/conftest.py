@@ -19,3 +19,15 @@ def clear_caches():
     clear_all_caches()
     yield
     clear_all_caches()
+
+
+@pytest.fixture(autouse=True)
+def disable_embedding_cache(monkeypatch):
+    """Keep tests off any persistent embedding cache set in the environment."""
+    from artsearch.src.config import config
+    from artsearch.src.utils import embedding_cache
+
+    monkeypatch.setattr(config, "embedding_cache_path", "")
+    embedding_cache.close_connection()
+    yield
+    embedding_cache.close_connection()
@@ -0,0 +1,247 @@
+"""
+Unit tests for the CLIP embedder's batched thumbnail pipeline.
+"""
+
+import random
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+import torch
+from PIL import Image
+
+from artsearch.src.services import clip_embedder
+from artsearch.src.services.clip_embedder import CLIPEmbedder, ImageDownloadError
+
+
+class _StubVisual:
+    input_resolution = 8
+
+
+class _StubModel:
+    """Returns each image's preprocessed tensor as its embedding."""
+
+    def __init__(self):
+        self.visual = _StubVisual()
+        self.batch_sizes: list[int] = []
+
+    def encode_image(self, batch: torch.Tensor) -> torch.Tensor:
+        self.batch_sizes.append(batch.shape[0])
+        return batch.clone()
+
+
+def _png_bytes(value: int) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (8, 8), color=(value, 0, 0)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _jpeg_bytes(value: int, mode: str = "RGB") -> bytes:
+    output = BytesIO()
+    Image.new(mode, (8, 8), color=value).save(output, format="JPEG")
+    return output.getvalue()
+
+
+def _jpeg_tensor(image_bytes: bytes) -> torch.Tensor:
+    return torch.frombuffer(bytearray(image_bytes), dtype=torch.uint8)
+
+
+def _fake_nvjpeg(unsupported: set[bytes]):
+    """decode_jpeg stand-in that, like nvJPEG, fails a whole batched call."""
+
+    def decode(jpegs, mode, device):
+        if isinstance(jpegs, list):
+            return [decode(jpeg, mode, device) for jpeg in jpegs]
+        image_bytes = jpegs.numpy().tobytes()
+        if image_bytes in unsupported:
+            raise RuntimeError("nvjpegDecode failed")
+        image = Image.open(BytesIO(image_bytes)).convert("RGB")
+        return torch.tensor(list(image.getdata()), dtype=torch.uint8).T.reshape(
+            3, 8, 8
+        )
+
+    return decode
+
+
+def _download(url: str) -> bytes:
+    # Finish out of order so the pipeline has to restore input order
+    time.sleep(random.random() / 100)
+    if url.endswith("/bad"):
+        raise ImageDownloadError(f"Error downloading image from {url}")
+    return _png_bytes(int(url.rsplit("/", 1)[-1]))
+
+
+@pytest.fixture
+def embedder():
+    embedder = CLIPEmbedder.__new__(CLIPEmbedder)
+    embedder.device = "cpu"
+    embedder.gpu_preprocess = False
+    embedder._pinned_buffer = None
+    embedder.model = _StubModel()
+    # The red channel of the top-left pixel identifies the image
+    embedder.preprocess = lambda img: torch.tensor(
+        img.getpixel((0, 0)), dtype=torch.float32
+    )
+    with patch.object(embedder, "_download_image_bytes", side_effect=_download):
+        yield embedder
+
+
+def _items(urls: list[str]) -> list[tuple[str, str]]:
+    return [(url, f"obj-{i}") for i, url in enumerate(urls)]
+
+
+@pytest.mark.unit
+class TestGenerateThumbnailEmbeddings:
+    def test_embeddings_follow_input_order(self, embedder):
+        urls = [f"https://example.com/{value}" for value in (5, 4, 3, 2, 1)]
+
+        results = list(
+            embedder.generate_thumbnail_embeddings(
+                _items(urls), batch_size=2, max_workers=4
+            )
+        )
+
+        assert [object_number for object_number, _ in results] == [
+            "obj-0",
+            "obj-1",
+            "obj-2",
+            "obj-3",
+            "obj-4",
+        ]
+        assert [embedding[0] for _, embedding in results] == [5, 4, 3, 2, 1]
+
+    def test_final_short_batch_is_encoded(self, embedder):
+        urls = [f"https://example.com/{value}" for value in range(1, 6)]
+
+        results = list(
+            embedder.generate_thumbnail_embeddings(_items(urls), batch_size=2)
+        )
+
+        assert embedder.model.batch_sizes == [2, 2, 1]
+        assert len(results) == 5
+        assert results[-1] == ("obj-4", [5.0, 0.0, 0.0])
+
+    def test_failed_downloads_yield_none_in_place(self, embedder):
+        urls = [
+            "https://example.com/1",
+            "https://example.com/bad",
+            "https://example.com/3",
+            "https://example.com/bad",
+            "https://example.com/5",
+        ]
+
+        results = list(
+            embedder.generate_thumbnail_embeddings(_items(urls), batch_size=2)
+        )
+
+        embeddings = [embedding for _, embedding in results]
+        assert embeddings[1] is None
+        assert embeddings[3] is None
+        assert [embeddings[i][0] for i in (0, 2, 4)] == [1, 3, 5]
+        # Failed downloads are left out of the forward pass
+        assert embedder.model.batch_sizes == [1, 1, 1]
+
+    def test_batch_of_failed_downloads_is_not_encoded(self, embedder):
+        urls = ["https://example.com/bad", "https://example.com/bad"]
+
+        results = list(
+            embedder.generate_thumbnail_embeddings(_items(urls), batch_size=2)
+        )
+
+        assert results == [("obj-0", None), ("obj-1", None)]
+        assert embedder.model.batch_sizes == []
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+class TestStackToDevice:
+    def test_pinned_buffer_is_reused_for_smaller_batches(self, embedder):
+        embedder.device = "cuda"
+        full = [torch.full((3, 2, 2), float(i)) for i in range(4)]
+
+        # .cpu() syncs, as _encode_images does before the buffer is reused
+        first = embedder._stack_to_device(full).cpu()
+        buffer = embedder._pinned_buffer
+        second = embedder._stack_to_device(full[:2]).cpu()
+
+        assert embedder._pinned_buffer is buffer
+        assert buffer.is_pinned()
+        assert torch.equal(first, torch.stack(full))
+        assert torch.equal(second, torch.stack(full[:2]))
+
+    def test_pinned_buffer_grows_for_larger_batches(self, embedder):
+        embedder.device = "cuda"
+        images = [torch.zeros(3, 2, 2) for _ in range(3)]
+
+        embedder._stack_to_device(images[:1])
+        embedder._stack_to_device(images)
+
+        assert embedder._pinned_buffer.shape[0] == 3
+
+
+@pytest.mark.unit
+class TestGpuPreprocess:
+    @pytest.fixture
+    def gpu_embedder(self, embedder):
+        # Runs on the CPU with decode_jpeg patched; only the control flow
+        # around nvJPEG is under test
+        embedder.gpu_preprocess = True
+        embedder.preprocess = lambda img: torch.full((3, 8, 8), 7.0)
+        return embedder
+
+    def test_only_rgb_and_grayscale_jpegs_are_sent_to_the_gpu(self, gpu_embedder):
+        downloads = {
+            "https://example.com/rgb": _jpeg_bytes((10, 0, 0)),
+            "https://example.com/gray": _jpeg_bytes(10, mode="L"),
+            "https://example.com/cmyk": _jpeg_bytes((0, 0, 0, 10), mode="CMYK"),
+            "https://example.com/png": _png_bytes(10),
+        }
+        gpu_embedder._download_image_bytes.side_effect = downloads.get
+
+        dims = {
+            url: gpu_embedder._load_image_tensor(url).dim() for url in downloads
+        }
+
+        assert dims == {
+            "https://example.com/rgb": 1,
+            "https://example.com/gray": 1,
+            "https://example.com/cmyk": 3,
+            "https://example.com/png": 3,
+        }
+
+    def test_unsupported_jpeg_falls_back_to_pillow(self, gpu_embedder):
+        bad = _jpeg_bytes((30, 0, 0))
+        jpegs = [_jpeg_bytes((10, 0, 0)), bad, _jpeg_bytes((20, 0, 0))]
+
+        with patch.object(clip_embedder, "decode_jpeg", _fake_nvjpeg({bad})):
+            embeddings = gpu_embedder._encode_images(
+                [_jpeg_tensor(jpeg) for jpeg in jpegs]
+            )
+
+        assert all(embedding is not None for embedding in embeddings)
+        assert gpu_embedder.model.batch_sizes == [3]
+        # The rejected JPEG went through Pillow and the stub preprocess
+        assert torch.equal(torch.tensor(embeddings[1]), torch.full((3, 8, 8), 7.0))
+
+    def test_undecodable_jpeg_is_none_and_keeps_others(self, gpu_embedder):
+        corrupt = b"\xff\xd8not a jpeg"
+        jpegs = [_jpeg_bytes((10, 0, 0)), corrupt, _jpeg_bytes((20, 0, 0))]
+
+        with patch.object(clip_embedder, "decode_jpeg", _fake_nvjpeg({corrupt})):
+            embeddings = gpu_embedder._encode_images(
+                [_jpeg_tensor(jpeg) for jpeg in jpegs]
+            )
+
+        assert embeddings[1] is None
+        assert embeddings[0] is not None and embeddings[2] is not None
+        assert gpu_embedder.model.batch_sizes == [2]
+
+    def test_batch_with_no_decodable_jpeg_is_not_encoded(self, gpu_embedder):
+        corrupt = b"\xff\xd8not a jpeg"
+
+        with patch.object(clip_embedder, "decode_jpeg", _fake_nvjpeg({corrupt})):
+            embeddings = gpu_embedder._encode_images([_jpeg_tensor(corrupt)])
+
+        assert embeddings == [None]
+        assert gpu_embedder.model.batch_sizes == []
@@ -0,0 +1,57 @@
+"""
+Unit tests for the persistent query embedding cache.
+"""
+
+import pytest
+
+from artsearch.src.config import config
+from artsearch.src.utils import embedding_cache
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "embeddings.sqlite3"
+    monkeypatch.setattr(config, "embedding_cache_path", str(path))
+    embedding_cache.close_connection()
+    yield path
+    embedding_cache.close_connection()
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    def test_miss_returns_none(self, cache_path):
+        assert embedding_cache.get_cached_embedding("ViT-L/14", "a cat") is None
+
+    def test_roundtrip(self, cache_path):
+        embedding_cache.set_cached_embedding("ViT-L/14", "a cat", [0.5, -1.0, 2.0])
+
+        assert embedding_cache.get_cached_embedding("ViT-L/14", "a cat") == [
+            0.5,
+            -1.0,
+            2.0,
+        ]
+        assert cache_path.exists()
+
+    def test_key_includes_model_name(self, cache_path):
+        embedding_cache.set_cached_embedding("ViT-L/14", "a cat", [1.0])
+
+        assert embedding_cache.get_cached_embedding("jina-clip-v2", "a cat") is None
+
+    def test_clear_all_caches_keeps_connection(self, cache_path):
+        from artsearch.src.cache_registry import clear_all_caches
+
+        embedding_cache.set_cached_embedding("ViT-L/14", "a cat", [1.0])
+        conn = embedding_cache._get_connection()
+
+        clear_all_caches()
+
+        assert embedding_cache._get_connection() is conn
+        assert embedding_cache.get_cached_embedding("ViT-L/14", "a cat") == [1.0]
+
+    def test_disabled_with_empty_path(self, monkeypatch):
+        monkeypatch.setattr(config, "embedding_cache_path", "")
+        embedding_cache.close_connection()
+
+        embedding_cache.set_cached_embedding("ViT-L/14", "a cat", [1.0])
+
+        assert embedding_cache.get_cached_embedding("ViT-L/14", "a cat") is None
@@ -0,0 +1,87 @@
+"""
+Unit tests for the Jina embedder's batched requests.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+from artsearch.src.services import jina_embedder
+from artsearch.src.services.jina_embedder import JinaEmbedder
+
+
+def _response(data: list[dict]) -> MagicMock:
+    response = MagicMock()
+    response.content = orjson.dumps({"data": data})
+    return response
+
+
+def _request_texts(body: bytes) -> list[str]:
+    return [item["text"] for item in orjson.loads(body)["input"]]
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    with patch.object(jina_embedder, "_get_session", return_value=session):
+        yield session
+
+
+@pytest.mark.unit
+class TestJinaBatchEmbeddings:
+    def test_embeddings_are_ordered_by_index(self, session):
+        session.post.return_value = _response(
+            [
+                {"index": 2, "embedding": [2.0]},
+                {"index": 0, "embedding": [0.0]},
+                {"index": 1, "embedding": [1.0]},
+            ]
+        )
+
+        embeddings = JinaEmbedder().generate_text_embeddings_batch(["a", "b", "c"])
+
+        assert embeddings == [[0.0], [1.0], [2.0]]
+
+    def test_short_response_fails_only_its_chunk(self, session):
+        def post(*args, **kwargs):
+            if _request_texts(kwargs["data"]) == ["a", "b"]:
+                # One embedding missing: must not shift "b" onto "a"
+                return _response([{"index": 1, "embedding": [1.0]}])
+            return _response(
+                [
+                    {"index": 0, "embedding": [2.0]},
+                    {"index": 1, "embedding": [3.0]},
+                ]
+            )
+
+        session.post.side_effect = post
+
+        embeddings = JinaEmbedder().generate_text_embeddings_batch(
+            ["a", "b", "c", "d"], batch_size=2
+        )
+
+        assert embeddings == [None, None, [2.0], [3.0]]
+
+    def test_duplicate_index_fails_the_chunk(self, session):
+        session.post.return_value = _response(
+            [
+                {"index": 0, "embedding": [0.0]},
+                {"index": 0, "embedding": [1.0]},
+            ]
+        )
+
+        embeddings = JinaEmbedder().generate_text_embeddings_batch(["a", "b"])
+
+        assert embeddings == [None, None]
+
+    def test_failed_request_returns_none_per_input(self, session):
+        session.post.return_value.raise_for_status.side_effect = RuntimeError(
+            "503 Server Error"
+        )
+
+        embeddings = JinaEmbedder().generate_image_embeddings_batch(
+            ["https://example.com/a.jpg", "https://example.com/b.jpg"]
+        )
+
+        assert embeddings == [None, None]
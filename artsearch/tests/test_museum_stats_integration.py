@@ -0,0 +1,77 @@
+"""
+Integration tests for the museum stats queries.
+
+Runs the raw SQL in museum_stats_service against the test database, since
+these queries cannot be checked without Postgres.
+"""
+
+import pytest
+
+from artsearch.models import ArtworkStats
+from artsearch.src.services import museum_stats_service
+
+
+@pytest.fixture
+def artwork_stats(db):
+    rows = [
+        ("smk", "1", ["painting"]),
+        ("smk", "2", ["painting", "drawing"]),
+        ("smk", "3", ["print"]),
+        ("cma", "1", ["painting"]),
+        ("met", "1", ["drawing"]),
+    ]
+    ArtworkStats.objects.bulk_create(
+        ArtworkStats(museum_slug=m, object_number=o, searchable_work_types=w)
+        for m, o, w in rows
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_work_type_counts_for_selected_museums(artwork_stats):
+    summary = museum_stats_service.aggregate_work_type_count_for_selected_museums(
+        ("cma", "smk")
+    )
+
+    # Total counts artworks, not work type tags (smk:2 has two types)
+    assert summary.total == 4
+    assert summary.work_types["painting"] == 3
+    assert summary.work_types["drawing"] == 1
+    assert summary.work_types["print"] == 1
+    # Known work types without matches are zero-filled
+    assert summary.work_types["watercolor"] == 0
+
+    # Ordered by count descending, ties by name, zero counts last
+    assert list(summary.work_types)[:3] == ["painting", "drawing", "print"]
+    counts = list(summary.work_types.values())
+    assert counts == sorted(counts, reverse=True)
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_work_type_counts_for_museum_without_artworks(artwork_stats):
+    summary = museum_stats_service.aggregate_work_type_count_for_selected_museums(
+        ("aic",)
+    )
+
+    assert summary.total == 0
+    assert set(summary.work_types.values()) == {0}
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_museum_counts_and_total_for_filters(artwork_stats):
+    summary = museum_stats_service.aggregate_museum_count_for_selected_work_types(
+        ("drawing", "painting")
+    )
+
+    assert summary.work_types == {"smk": 2, "cma": 1, "met": 1}
+    assert list(summary.work_types)[0] == "smk"
+    assert summary.total == 4
+
+    assert (
+        museum_stats_service.get_total_works_for_filters(
+            ("met", "smk"), ("drawing", "print")
+        )
+        == 3
+    )
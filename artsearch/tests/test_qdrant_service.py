@@ -0,0 +1,57 @@
+"""
+Unit tests for looking up artworks by object number in Qdrant.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from artsearch.src.services import qdrant_service
+from artsearch.src.services.qdrant_service import _get_items_by_object_number_cached
+from etl.utils import generate_uuid5
+
+
+@pytest.fixture
+def qdrant_client():
+    client = MagicMock()
+    _get_items_by_object_number_cached.cache_clear()
+    with patch.object(qdrant_service, "get_qdrant_client", return_value=client):
+        yield client
+    _get_items_by_object_number_cached.cache_clear()
+
+
+@pytest.mark.unit
+class TestGetItemsByObjectNumber:
+    def test_known_museum_uses_point_id(self, qdrant_client):
+        point = MagicMock()
+        qdrant_client.retrieve.return_value = [point]
+
+        items = _get_items_by_object_number_cached("KMS1", "smk")
+
+        assert items == [point]
+        assert qdrant_client.retrieve.call_args.kwargs["ids"] == [
+            generate_uuid5("smk", "KMS1")
+        ]
+        qdrant_client.query_points.assert_not_called()
+
+    def test_known_museum_miss_is_a_single_round_trip(self, qdrant_client):
+        qdrant_client.retrieve.return_value = []
+
+        items = _get_items_by_object_number_cached("UNKNOWN", "smk")
+
+        assert items == []
+        qdrant_client.retrieve.assert_called_once()
+        qdrant_client.query_points.assert_not_called()
+
+    def test_unknown_museum_filters_by_object_number(self, qdrant_client):
+        point = MagicMock()
+        qdrant_client.query_points.return_value.points = [point]
+
+        items = _get_items_by_object_number_cached("KMS1")
+
+        assert items == [point]
+        qdrant_client.retrieve.assert_not_called()
+        query_filter = qdrant_client.query_points.call_args.kwargs["query_filter"]
+        assert [condition.key for condition in query_filter.must] == [
+            "object_number"
+        ]
@@ -315,7 +315,7 @@ def build_work_type_filter_context(params: SearchParams) -> FilterContext:
     selected_work_types = params.selected_work_types
 
     work_type_summary = aggregate_work_type_count_for_selected_museums(
-        tuple(selected_museums)
+        tuple(sorted(selected_museums))
     )
     prepared_work_types = prepare_work_types_for_dropdown(work_type_summary.work_types)
 
@@ -346,7 +346,7 @@ def build_museum_filter_context(params: SearchParams) -> FilterContext:
     selected_work_types = params.selected_work_types
 
     museum_summary = aggregate_museum_count_for_selected_work_types(
-        tuple(selected_work_types)
+        tuple(sorted(selected_work_types))
     )
     prepared_museums = prepare_museums_for_dropdown(museum_summary.work_types)
 
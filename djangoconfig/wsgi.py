@@ -14,3 +14,20 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'djangoconfig.settings')
 
 application = get_wsgi_application()
+
+# Load and warm up CLIP and the stats caches when the worker boots instead of
+# on the first request.
+# Skipped in debug so runserver reloads stay fast.
+from artsearch.src.config import config  # noqa: E402
+
+if not config.debug:
+    import threading  # noqa: E402
+
+    from artsearch.src.services.clip_embedder import get_clip_embedder  # noqa: E402
+    from artsearch.src.services.museum_stats_service import (  # noqa: E402
+        warm_stats_caches,
+    )
+
+    # Warm the filter dropdown counts in the background while CLIP loads.
+    threading.Thread(target=warm_stats_caches, daemon=True).start()
+    get_clip_embedder()
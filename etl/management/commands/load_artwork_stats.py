@@ -8,6 +8,8 @@ Usage:
     python manage.py load_artwork_stats [--drop-existing]
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from artsearch.models import ArtworkStats
@@ -88,51 +90,66 @@ class Command(BaseCommand):
         next_page_token = None
         processed_count = 0
 
-        while True:
-            points, next_page_token = qdrant_service.fetch_points(
-                next_page_token,
-                limit=batch_size,
-                with_payload=["museum", "object_number", "searchable_work_types"],
-            )
+        fetch_page = partial(
+            qdrant_service.fetch_points,
+            limit=batch_size,
+            with_payload=["museum", "object_number", "searchable_work_types"],
+        )
 
-            for point in points:
-                payload = point.payload
-                if payload is None:
-                    logger.warning(f"Skipping point {point.id} with missing payload")
-                    continue
-
-                museum = payload.get("museum")
-                object_number = payload.get("object_number")
-                searchable_work_types = payload.get("searchable_work_types", [])
-
-                # Validation
-                if not museum:
-                    logger.warning(f"Skipping point {point.id} with missing museum")
-                    continue
-                if not object_number:
-                    logger.warning(
-                        f"Skipping point {point.id} with missing object_number"
-                    )
-                    continue
-                if not isinstance(searchable_work_types, list):
-                    logger.warning(
-                        f"Skipping point {point.id} with invalid searchable_work_types"
+        # Double-buffer the scroll: request the next page before validating
+        # the current one, so the Qdrant round trip overlaps the Python loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch_page, next_page_token)
+            while True:
+                points, next_page_token = next_page.result()
+                if next_page_token is not None:
+                    next_page = executor.submit(fetch_page, next_page_token)
+
+                for point in points:
+                    payload = point.payload
+                    if payload is None:
+                        logger.warning(
+                            f"Skipping point {point.id} with missing payload"
+                        )
+                        continue
+
+                    museum = payload.get("museum")
+                    object_number = payload.get("object_number")
+                    searchable_work_types = payload.get("searchable_work_types", [])
+
+                    # Validation
+                    if not museum:
+                        logger.warning(
+                            f"Skipping point {point.id} with missing museum"
+                        )
+                        continue
+                    if not object_number:
+                        logger.warning(
+                            f"Skipping point {point.id} with missing object_number"
+                        )
+                        continue
+                    if not isinstance(searchable_work_types, list):
+                        logger.warning(
+                            f"Skipping point {point.id} with invalid "
+                            "searchable_work_types"
+                        )
+                        continue
+
+                    artwork_records.append(
+                        {
+                            "museum_slug": museum,
+                            "object_number": object_number,
+                            "searchable_work_types": searchable_work_types,
+                        }
                     )
-                    continue
-
-                artwork_records.append(
-                    {
-                        "museum_slug": museum,
-                        "object_number": object_number,
-                        "searchable_work_types": searchable_work_types,
-                    }
-                )
 
-            processed_count += len(points)
-            self.stdout.write(f"  Processed {processed_count} points...", ending="\r")
+                processed_count += len(points)
+                self.stdout.write(
+                    f"  Processed {processed_count} points...", ending="\r"
+                )
 
-            if next_page_token is None:
-                break
+                if next_page_token is None:
+                    break
 
         self.stdout.write("")  # New line after progress
         return artwork_records
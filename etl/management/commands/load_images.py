@@ -124,6 +124,8 @@ class Command(BaseCommand):
                     museum_filter=museum_filter,
                     delay_seconds=delay_seconds,
                     batch_delay_seconds=batch_delay_seconds,
+                    # Only a forced reload re-uploads images already in the bucket
+                    overwrite=force_reload,
                 )
 
                 # If no records were processed, we're done
@@ -1,7 +1,9 @@
 import logging
+import orjson
 import requests
 import time
 from typing import Any
+from artsearch.src.utils.session_config import get_configured_session
 from etl.pipeline.extract.helpers.upsert_raw_data import store_raw_data
 
 
@@ -65,7 +67,7 @@ def fetch_raw_data_from_aic_api(
             logging.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
             time.sleep(2**attempt)  # Exponential backoff
 
-    data = response.json()
+    data = orjson.loads(response.content)
     pagination = data.get("pagination", {})
 
     return {
@@ -92,7 +94,7 @@ def store_raw_data_aic(force_refetch: bool = False):
         force_refetch: If True, refetch all items regardless of existing data
     """
     start_time = time.time()
-    http_session = requests.Session()
+    http_session = get_configured_session()
 
     total_num_created = 0
     total_num_updated = 0
@@ -114,7 +116,7 @@ def store_raw_data_aic(force_refetch: bool = False):
 
         try:
             data = fetch_raw_data_from_aic_api(query, http_session)
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logging.error(f"Failed to fetch data at page {page}: {e}")
             break
 
@@ -1,6 +1,8 @@
 import logging
+import orjson
 import requests
 import time
+from artsearch.src.utils.session_config import get_configured_session
 from etl.pipeline.extract.helpers.upsert_raw_data import store_raw_data
 from etl.models import MetaDataRaw
 
@@ -34,7 +36,7 @@ def get_dept_object_ids(
         logging.error(f"Error fetching department {department_id} object IDs: {e}")
         raise
     else:
-        return resp.json().get("objectIDs", [])
+        return orjson.loads(resp.content).get("objectIDs", [])
 
 
 def get_item(object_id: int, http_session: requests.Session) -> dict | None:
@@ -45,7 +47,7 @@ def get_item(object_id: int, http_session: requests.Session) -> dict | None:
         try:
             item = http_session.get(object_url, timeout=10)
             item.raise_for_status()
-            return item.json()
+            return orjson.loads(item.content)
         except requests.HTTPError as e:
             if e.response.status_code == 404:
                 logging.warning(f"Object {object_id} not found (404), skipping")
@@ -55,7 +57,7 @@ def get_item(object_id: int, http_session: requests.Session) -> dict | None:
                 f"Attempt {attempt + 1} failed for object {object_id}: {e}. Retrying..."
             )
             time.sleep(3**attempt)  # Exponential backoff: 1s, 3s, 9s
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logging.warning(
                 f"Attempt {attempt + 1} failed for object {object_id}: {e}. Retrying..."
             )
@@ -76,7 +78,7 @@ def get_object_ids_by_search(
         logging.error(f"Error searching items: {e}")
         raise
     else:
-        return resp.json().get("objectIDs", [])
+        return orjson.loads(resp.content).get("objectIDs", [])
 
 
 def filter_objects(object_ids: list[int]) -> list[int]:
@@ -125,10 +127,16 @@ def handle_met_upload(
     total_num_updated = 0
     total_num_skipped = 0
 
+    last_request_start = float("-inf")
     for idx, object_id in enumerate(objects_to_fetch):
         logging.info(f"Processing {idx + 1} of {len(objects_to_fetch)} objects...")
 
-        time.sleep(SLEEP_BETWEEN_REQUESTS)  # to avoid rate limiting
+        # Space request starts SLEEP_BETWEEN_REQUESTS apart to avoid rate limiting.
+        # Time spent on the previous fetch and upsert counts towards the wait.
+        wait = SLEEP_BETWEEN_REQUESTS - (time.monotonic() - last_request_start)
+        if wait > 0:
+            time.sleep(wait)
+        last_request_start = time.monotonic()
 
         try:
             item = get_item(object_id, http_session)
@@ -184,7 +192,7 @@ def handle_met_upload(
 
 def store_raw_data_met(force_refetch: bool = False) -> None:
     all_object_ids = set()
-    http_session = requests.Session()
+    http_session = get_configured_session()
 
     # Department-wise object IDs
     for department_id in MET_DEPARTMENTS.keys():
@@ -1,11 +1,18 @@
 import logging
+import orjson
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 import xmltodict
+from artsearch.src.utils.session_config import get_configured_session
 from etl.pipeline.extract.helpers.upsert_raw_data import store_raw_data
 from etl.pipeline.extract.utils import extract_query_param
-from etl.pipeline.shared.rma_utils import extract_provided_cho, extract_object_number
+from etl.pipeline.shared.rma_utils import (
+    extract_object_number,
+    extract_provided_cho,
+    extract_rdf,
+)
 from etl.models import MetaDataRaw
 
 MUSEUM_SLUG = "rma"
@@ -16,12 +23,12 @@ WORK_TYPES = [
 BASE_QUERY = {}
 BASE_SEARCH_URL = "https://data.rijksmuseum.nl/search/collection"
 GET_RECORD_URL = "https://data.rijksmuseum.nl/oai?verb=GetRecord&metadataPrefix=edm&identifier=https://id.rijksmuseum.nl/"
-STATS = {}
+RECORD_FETCH_WORKERS = 8  # concurrent GetRecord requests per page
 
 
 def fetch_record(item_id: str, http_session: requests.Session) -> dict[str, Any]:
     item_url = GET_RECORD_URL + item_id
-    response = http_session.get(item_url)
+    response = http_session.get(item_url, timeout=10)
     response.raise_for_status()
     data = xmltodict.parse(response.content)
     record = data["OAI-PMH"]["GetRecord"]["record"]
@@ -42,7 +49,7 @@ def fetch_raw_data_from_rma_api(
                 raise
             logging.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     total_count = data["partOf"]["totalItems"]
     items = data.get("orderedItems", [])
     next = data.get("next", None)
@@ -56,116 +63,161 @@ def fetch_raw_data_from_rma_api(
 
 
 def store_raw_data_rma(force_refetch: bool = False):
+    """
+    Fetch and store RMA records for all WORK_TYPES.
+
+    Args:
+        force_refetch: If True, refetch records that are already stored
+    """
     start_time = time.time()
 
-    http_session = requests.Session()
-
-    for work_type in WORK_TYPES:
-        logging.info(f"Processing work type: {work_type}")
-
-        total_num_created = 0
-        total_num_updated = 0
-        total_num_skipped = 0
-        items_so_far = 0
-        page_token = ""
-
-        while True:
-            num_created = 0
-            num_updated = 0
-            num_skipped = 0
-            base_query = BASE_QUERY.copy()
-            query = base_query | {
-                "type": work_type,
-                "pageToken": page_token,
-            }
-
-            try:
-                data = fetch_raw_data_from_rma_api(query, http_session)
-            except requests.RequestException as e:
-                logging.error(
-                    f"Failed to fetch data for work type {work_type} at page token {page_token}: {e}"
+    # Record fetch workers plus the next-page prefetch
+    http_session = get_configured_session(pool_maxsize=RECORD_FETCH_WORKERS + 1)
+
+    with ThreadPoolExecutor(max_workers=1) as page_executor:
+        for work_type in WORK_TYPES:
+            logging.info(f"Processing work type: {work_type}")
+
+            total_num_created = 0
+            total_num_updated = 0
+            total_num_skipped = 0
+            total_num_already_fetched = 0
+            items_so_far = 0
+            page_token = ""
+            next_page = None  # Future for the prefetched next page
+
+            while True:
+                num_created = 0
+                num_updated = 0
+                num_skipped = 0
+                base_query = BASE_QUERY.copy()
+                query = base_query | {
+                    "type": work_type,
+                    "pageToken": page_token,
+                }
+
+                try:
+                    if next_page is not None:
+                        data = next_page.result()
+                    else:
+                        data = fetch_raw_data_from_rma_api(query, http_session)
+                except (requests.RequestException, orjson.JSONDecodeError) as e:
+                    logging.error(
+                        f"Failed to fetch data for work type {work_type} at page token {page_token}: {e}"
+                    )
+                    break
+
+                items = data.get("items", [])
+                total = data.get("total_count", 0)
+                items_so_far += len(items)
+                next_page_token = data.get("next_page_token", None)
+
+                # Fetch the next search page while this page's records are processed
+                next_page = None
+                if next_page_token and next_page_token.strip():
+                    next_page = page_executor.submit(
+                        fetch_raw_data_from_rma_api,
+                        BASE_QUERY | {"type": work_type, "pageToken": next_page_token},
+                        http_session,
+                    )
+
+                logging.info(
+                    f"Upserting {len(items)} items. Items so far: {items_so_far}/{total} for work type: {work_type}."
                 )
-                break
 
-            items = data.get("items", [])
-            total = data.get("total_count", 0)
-            items_so_far += len(items)
-            next_page_token = data.get("next_page_token", None)
+                item_ids = [item["id"].rsplit("/", 1)[-1] for item in items]
+                if not force_refetch:
+                    # Records already stored by an earlier (possibly interrupted) run
+                    # are not fetched again
+                    already_fetched = set(
+                        MetaDataRaw.objects.filter(
+                            museum_slug=MUSEUM_SLUG, museum_db_id__in=item_ids
+                        ).values_list("museum_db_id", flat=True)
+                    )
+                    item_ids = [i for i in item_ids if i not in already_fetched]
+                    num_already_fetched = len(items) - len(item_ids)
+                    total_num_already_fetched += num_already_fetched
+                    logging.info(f"Already fetched (skipping): {num_already_fetched}")
+
+                # Fetch the page's records concurrently (kept in page order), then
+                # run the duplicate checks and upserts sequentially
+                with ThreadPoolExecutor(max_workers=RECORD_FETCH_WORKERS) as executor:
+                    records = list(
+                        executor.map(
+                            lambda item_id: fetch_record(item_id, http_session), item_ids
+                        )
+                    )
 
-            logging.info(
-                f"Upserting {len(items)} items. Items so far: {items_so_far}/{total} for work type: {work_type}."
-            )
+                for item_id, record in zip(item_ids, records):
+                    # Extract object_number from complex RMA structure
+                    try:
+                        rdf = extract_rdf(record)
+                        provided_cho = extract_provided_cho(rdf)
+                        object_number = (
+                            extract_object_number(provided_cho) if provided_cho else None
+                        )
 
-            for item in items:
-                item_id = item["id"].split("/")[-1]
-                record = fetch_record(item_id, http_session)
+                        if not object_number:
+                            logging.warning(
+                                f"Skipping RMA item {item_id} - missing object_number"
+                            )
+                            continue
 
-                # Extract object_number from complex RMA structure
-                try:
-                    metadata = record.get("metadata", {})
-                    rdf = metadata.get("rdf:RDF", {})
-                    provided_cho = extract_provided_cho(rdf)
-                    object_number = (
-                        extract_object_number(provided_cho) if provided_cho else None
-                    )
+                    except Exception as e:
+                        logging.error(
+                            f"Error extracting object_number for RMA item {item_id}: {e}"
+                        )
+                        continue
 
-                    if not object_number:
+                    # Check for duplicate object_number with different museum_db_id
+                    # Prevents flip-flop bug and data corruption in downstream pipeline
+                    existing = MetaDataRaw.objects.filter(
+                        museum_slug=MUSEUM_SLUG,
+                        object_number=object_number
+                    ).exclude(museum_db_id=item_id).first()
+
+                    if existing:
                         logging.warning(
-                            f"Skipping RMA item {item_id} - missing object_number"
+                            f"Skipping RMA item {item_id} - duplicate object_number "
+                            f"'{object_number}' already exists with museum_db_id {existing.museum_db_id}"
                         )
+                        num_skipped += 1
+                        total_num_skipped += 1
                         continue
 
-                except Exception as e:
-                    logging.error(
-                        f"Error extracting object_number for RMA item {item_id}: {e}"
+                    created = store_raw_data(
+                        museum_slug=MUSEUM_SLUG,
+                        object_number=object_number,
+                        raw_json=record,
+                        museum_db_id=item_id,
                     )
-                    continue
-
-                # Check for duplicate object_number with different museum_db_id
-                # Prevents flip-flop bug and data corruption in downstream pipeline
-                existing = MetaDataRaw.objects.filter(
-                    museum_slug=MUSEUM_SLUG,
-                    object_number=object_number
-                ).exclude(museum_db_id=item_id).first()
-
-                if existing:
-                    logging.warning(
-                        f"Skipping RMA item {item_id} - duplicate object_number "
-                        f"'{object_number}' already exists with museum_db_id {existing.museum_db_id}"
+                    if created:
+                        num_created += 1
+                        total_num_created += 1
+                    else:
+                        num_updated += 1
+                        total_num_updated += 1
+
+                logging.info(f"Number of items created in current batch: {num_created}")
+                logging.info(f"Number of items updated in current batch: {num_updated}")
+                logging.info(f"Number of items skipped in current batch: {num_skipped}")
+
+                if next_page_token is None or not next_page_token.strip():
+                    logging.info(f"All items processed for work type: {work_type}.")
+                    logging.info(
+                        f"Total items created for {work_type}: {total_num_created}"
                     )
-                    num_skipped += 1
-                    total_num_skipped += 1
-                    continue
-
-                created = store_raw_data(
-                    museum_slug=MUSEUM_SLUG,
-                    object_number=object_number,
-                    raw_json=record,
-                    museum_db_id=item_id,
-                )
-                if created:
-                    num_created += 1
-                    total_num_created += 1
-                else:
-                    num_updated += 1
-                    total_num_updated += 1
-
-            logging.info(f"Number of items created in current batch: {num_created}")
-            logging.info(f"Number of items updated in current batch: {num_updated}")
-            logging.info(f"Number of items skipped in current batch: {num_skipped}")
-
-            if next_page_token is None or not next_page_token.strip():
-                logging.info(f"All items processed for work type: {work_type}.")
-                logging.info(
-                    f"Total items created for {work_type}: {total_num_created}"
-                )
-                logging.info(
-                    f"Total items updated for {work_type}: {total_num_updated}"
-                )
-                logging.info(
-                    f"Total items skipped for {work_type}: {total_num_skipped}"
-                )
-                break
-            page_token = next_page_token
+                    logging.info(
+                        f"Total items updated for {work_type}: {total_num_updated}"
+                    )
+                    logging.info(
+                        f"Total items skipped for {work_type}: {total_num_skipped}"
+                    )
+                    logging.info(
+                        f"Total items already fetched for {work_type}: "
+                        f"{total_num_already_fetched}"
+                    )
+                    break
+                page_token = next_page_token
 
     logging.info(f"Total time taken: {time.time() - start_time:.2f} seconds")
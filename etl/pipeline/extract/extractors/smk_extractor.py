@@ -1,7 +1,9 @@
 import logging
+import orjson
 import requests
 import time
 from typing import Any
+from artsearch.src.utils.session_config import get_configured_session
 from etl.pipeline.extract.helpers.upsert_raw_data import store_raw_data
 
 MUSEUM_SLUG = "smk"
@@ -48,14 +50,14 @@ def fetch_raw_data_from_smk_api(
                 raise
             logging.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     return {"total_count": data.get("found", 0), "items": data.get("items", [])}
 
 
 def store_raw_data_smk(force_refetch: bool = False):
     start_time = time.time()
 
-    http_session = requests.Session()
+    http_session = get_configured_session()
 
     for work_type in WORK_TYPES:
         logging.info(f"Processing work type: {work_type}")
@@ -74,7 +76,7 @@ def store_raw_data_smk(force_refetch: bool = False):
             }
             try:
                 data = fetch_raw_data_from_smk_api(query, http_session)
-            except requests.RequestException as e:
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
                 logging.error(
                     f"Failed to fetch data for work type {work_type} at offset {offset}: {e}"
                 )
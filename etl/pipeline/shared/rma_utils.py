@@ -7,6 +7,18 @@ in both extraction and transformation pipeline stages.
 
 from typing import Any
 
+# Shared read-only default for chained .get() lookups (avoids a new {} per call)
+_EMPTY: dict[str, Any] = {}
+
+
+def extract_rdf(raw_json: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the rdf:RDF section of a stored RMA record (empty dict if missing).
+
+    The returned empty dict is shared, so callers must not mutate the result.
+    """
+    return raw_json.get("metadata", _EMPTY).get("rdf:RDF", _EMPTY)
+
 
 def extract_provided_cho(rdf_data: dict[str, Any]) -> dict[str, Any] | None:
     """
@@ -24,9 +36,9 @@ def extract_provided_cho(rdf_data: dict[str, Any]) -> dict[str, Any] | None:
     if not rdf_data:
         return None
 
-    provided_cho = rdf_data.get("ore:Aggregation", {}).get("edm:aggregatedCHO", {}).get(
-        "edm:ProvidedCHO"
-    ) or rdf_data.get("edm:ProvidedCHO")
+    provided_cho = rdf_data.get("ore:Aggregation", _EMPTY).get(
+        "edm:aggregatedCHO", _EMPTY
+    ).get("edm:ProvidedCHO") or rdf_data.get("edm:ProvidedCHO")
 
     return provided_cho
 
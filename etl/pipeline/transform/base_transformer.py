@@ -70,7 +70,7 @@ class BaseTransformer(ABC):
             # Extract work types and validate
             work_types = self.extract_work_types(transformer_args.raw_json)
             searchable_work_types = self.extract_searchable_work_types(
-                transformer_args.raw_json
+                transformer_args.raw_json, work_types
             )
 
             if not searchable_work_types:
@@ -150,13 +150,17 @@ class BaseTransformer(ABC):
         pass
 
     @abstractmethod
-    def extract_searchable_work_types(self, raw_json: dict) -> list[str]:
+    def extract_searchable_work_types(
+        self, raw_json: dict, work_types: Optional[list[str]] = None
+    ) -> list[str]:
         """
         Extract searchable work types from raw JSON data.
 
         These are the standardized work types that users can filter by in search.
         Each museum can implement this using their own logic, or delegate to
         the generic get_searchable_work_types() helper function.
+        work_types, if given, is the result of extract_work_types(raw_json) and
+        saves extracting it a second time.
         """
         pass
 
@@ -43,11 +43,14 @@ class MetTransformer(BaseTransformer):
 
         return list(work_types)
 
-    def extract_searchable_work_types(self, raw_json: dict) -> list[str]:
+    def extract_searchable_work_types(
+        self, raw_json: dict, work_types: Optional[list[str]] = None
+    ) -> list[str]:
         """Extract searchable work types using current helper function."""
         # Default implementation using extracted work type and helper function.
         # We could make a version that is both museum specific and independent of the extracted work types, if needed.
-        work_types = self.extract_work_types(raw_json)
+        if work_types is None:
+            work_types = self.extract_work_types(raw_json)
         return get_searchable_work_types(work_types)
 
     def extract_title(self, raw_json: dict) -> Optional[str]:
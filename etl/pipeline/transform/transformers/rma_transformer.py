@@ -3,7 +3,14 @@ import re
 from typing import Optional, Any
 from etl.pipeline.transform.base_transformer import BaseTransformer
 from etl.pipeline.transform.utils import get_searchable_work_types
-from etl.pipeline.shared.rma_utils import extract_provided_cho, extract_object_number
+from etl.pipeline.shared.rma_utils import (
+    extract_object_number,
+    extract_provided_cho,
+    extract_rdf,
+)
+
+# Years with 3 or 4 digits, e.g. "ca. 1650 - 1655" -> ["1650", "1655"]
+YEAR_PATTERN = re.compile(r"\d{3,4}")
 
 
 class RmaTransformer(BaseTransformer):
@@ -40,8 +47,7 @@ class RmaTransformer(BaseTransformer):
 
     def extract_thumbnail_url(self, raw_json: dict) -> Optional[str]:
         """Extract thumbnail URL from RMA image data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         image_url = extract_image_url_from_rdf(rdf)
         if not image_url or not is_valid_image_url(image_url):
@@ -52,23 +58,24 @@ class RmaTransformer(BaseTransformer):
 
     def extract_work_types(self, raw_json: dict) -> list[str]:
         """Extract work types from RMA RDF data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         work_types = extract_worktypes(rdf)
         return work_types or []
 
-    def extract_searchable_work_types(self, raw_json: dict) -> list[str]:
+    def extract_searchable_work_types(
+        self, raw_json: dict, work_types: Optional[list[str]] = None
+    ) -> list[str]:
         """Extract searchable work types using current helper function."""
         # Default implementation using extracted work type and helper function.
         # We could make a version that is both museum specific and independent of the extracted work types, if needed.
-        work_types = self.extract_work_types(raw_json)
+        if work_types is None:
+            work_types = self.extract_work_types(raw_json)
         return get_searchable_work_types(work_types)
 
     def extract_title(self, raw_json: dict) -> Optional[str]:
         """Extract title from RMA provided CHO."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
         provided_cho = extract_provided_cho(rdf)
 
         if provided_cho:
@@ -77,15 +84,13 @@ class RmaTransformer(BaseTransformer):
 
     def extract_artists(self, raw_json: dict) -> list[str]:
         """Extract artist names from RMA RDF data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         return extract_artist_names(rdf)
 
     def extract_creation_date_string(self, raw_json: dict) -> Optional[str]:
         """Extract creation date string from RMA provided CHO."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
         provided_cho = extract_provided_cho(rdf)
 
         if provided_cho:
@@ -109,8 +114,7 @@ class RmaTransformer(BaseTransformer):
 
     def extract_image_url(self, raw_json: dict) -> Optional[str]:
         """Extract original resolution image URL from RMA data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         image_url = extract_image_url_from_rdf(rdf)
         if image_url and is_valid_image_url(image_url):
@@ -119,8 +123,7 @@ class RmaTransformer(BaseTransformer):
 
     def extract_description(self, raw_json: dict) -> Optional[str]:
         """Extract description from RMA provided CHO."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
         provided_cho = extract_provided_cho(rdf)
 
         if provided_cho:
@@ -129,22 +132,19 @@ class RmaTransformer(BaseTransformer):
 
     def extract_medium(self, raw_json: dict) -> Optional[list[str]]:
         """Extract medium from RMA RDF data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         return extract_medium(rdf)
 
     def extract_creator_info(self, raw_json: dict) -> list[dict[str, Any]]:
         """Extract comprehensive creator information for LLM consumption."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         return extract_creator_info(rdf)
 
     def extract_references(self, raw_json: dict) -> Optional[list[str]]:
         """Extract bibliographic references from RMA RDF data."""
-        metadata = raw_json.get("metadata", {})
-        rdf = metadata.get("rdf:RDF", {})
+        rdf = extract_rdf(raw_json)
 
         return extract_references(rdf)
 
@@ -163,12 +163,10 @@ def resize_image_to_thumbnail(image_url: str, width=800) -> str:
 
 
 def extract_image_url_from_rdf(rdf_data: dict) -> str | None:
-    # Check if ".jpg" is in str(rdf_data):
-    if ".jpg" not in str(rdf_data):
-        return None
-
+    # Callers validate the result with is_valid_image_url (which requires a
+    # .jpg URL), so there is no need to stringify the whole record up front.
     aggregation = rdf_data.get("ore:Aggregation")
-    if not aggregation:
+    if not aggregation or not isinstance(aggregation, dict):
         return None
 
     # Try edm:isShownBy first
@@ -312,11 +310,15 @@ def extract_worktypes(rdf_data: dict[str, Any]) -> list[str] | None:
             return None
 
         type_ids = extract_type_ids(type_data)
-        concept_lookup = {
-            concept["@rdf:about"]: concept["skos:prefLabel"]
-            for concept in concepts
-            if "@rdf:about" in concept and "skos:prefLabel" in concept
-        }
+        # Only index the concepts we need, stopping once all are found
+        needed = set(type_ids)
+        concept_lookup = {}
+        for concept in normalize_to_list(concepts):
+            about = concept.get("@rdf:about")
+            if about in needed and "skos:prefLabel" in concept:
+                concept_lookup.setdefault(about, concept["skos:prefLabel"])
+                if len(concept_lookup) == len(needed):
+                    break
 
         for type_id in type_ids:
             labels = concept_lookup.get(type_id)
@@ -480,6 +482,7 @@ def extract_artist_names(rdf_data: dict) -> list[str]:
 
     creators = normalize_to_list(dc_creator)
     artist_names = []
+    agent_index = None  # built on first @rdf:resource reference
 
     for creator in creators:
         assert isinstance(creator, (dict, str)), (
@@ -503,8 +506,9 @@ def extract_artist_names(rdf_data: dict) -> list[str]:
 
         # Case 3: Reference via @rdf:resource
         if isinstance(creator, dict) and "@rdf:resource" in creator:
-            ref = creator["@rdf:resource"]
-            name = resolve_agent_label(rdf_data, ref)
+            if agent_index is None:
+                agent_index = build_agent_index(rdf_data)
+            name = resolve_agent_label(agent_index, creator["@rdf:resource"])
             if name:
                 artist_names.append(name)
             continue
@@ -546,6 +550,7 @@ def extract_creator_info(rdf_data: dict) -> list[dict[str, Any]]:
 
     creators = normalize_to_list(dc_creator)
     creator_info_list = []
+    agent_index = None  # built on first @rdf:resource reference
 
     for creator in creators:
         # Case 1: Direct string - just name
@@ -569,8 +574,9 @@ def extract_creator_info(rdf_data: dict) -> list[dict[str, Any]]:
 
         # Case 4: Reference via @rdf:resource
         elif "@rdf:resource" in creator:
-            ref = creator["@rdf:resource"]
-            agent_data = resolve_agent_data(rdf_data, ref)
+            if agent_index is None:
+                agent_index = build_agent_index(rdf_data)
+            agent_data = agent_index.get(creator["@rdf:resource"])
 
         if agent_data:
             creator_info = extract_agent_fields(agent_data)
@@ -580,24 +586,19 @@ def extract_creator_info(rdf_data: dict) -> list[dict[str, Any]]:
     return creator_info_list
 
 
-def resolve_agent_data(rdf_data: dict, ref: str) -> dict | None:
+def build_agent_index(rdf_data: dict) -> dict[str, dict]:
     """
-    Resolve full agent data from @rdf:resource reference.
-    Returns the complete agent/description dictionary.
+    Map @rdf:about to the full agent/description dictionary, so @rdf:resource
+    references resolve with a lookup instead of a scan per creator.
+    edm:Agent takes precedence over rdf:Description, and the first entry wins.
     """
-    # Search edm:Agent first
-    agents = normalize_to_list(rdf_data.get("edm:Agent"))
-    for agent in agents:
-        if agent.get("@rdf:about") == ref:
-            return agent
-
-    # If not found, search rdf:Description
-    descriptions = normalize_to_list(rdf_data.get("rdf:Description"))
-    for desc in descriptions:
-        if desc.get("@rdf:about") == ref:
-            return desc
-
-    return None
+    agent_index: dict[str, dict] = {}
+    for key in ("edm:Agent", "rdf:Description"):
+        for agent in normalize_to_list(rdf_data.get(key)):
+            about = agent.get("@rdf:about")
+            if about:
+                agent_index.setdefault(about, agent)
+    return agent_index
 
 
 def extract_agent_fields(agent_data: dict) -> dict[str, Any]:
@@ -772,38 +773,23 @@ def extract_production_years(create_date_str: str | None) -> tuple[int, int] | N
     if not create_date_str:
         return None
 
-    # Match years with 3 or 4 digits
-    years = re.findall(r"\d{3,4}", create_date_str)
+    years = [int(year) for year in YEAR_PATTERN.findall(create_date_str)]
 
     if not years:
         return None
 
-    years = list(map(int, years))
-
-    if len(years) == 1:
-        return (years[0], years[0])
-    else:
-        return (min(years), max(years))
+    return (min(years), max(years))
 
 
-def resolve_agent_label(rdf_data: dict, ref: str) -> str | None:
+def resolve_agent_label(agent_index: dict[str, dict], ref: str) -> str | None:
     """
-    Resolve an agent label from @rdf:resource by searching edm:Agent and rdf:Description.
+    Resolve an agent label from @rdf:resource using an index from build_agent_index.
     """
-    # Search edm:Agent first
-    agents = normalize_to_list(rdf_data.get("edm:Agent"))
-    for agent in agents:
-        if agent.get("@rdf:about") == ref:
-            return parse_label(agent.get("skos:prefLabel"))
-
-    # If not found, search rdf:Description
-    descriptions = normalize_to_list(rdf_data.get("rdf:Description"))
-    for desc in descriptions:
-        if desc.get("@rdf:about") == ref:
-            return parse_label(desc.get("skos:prefLabel"))
-
-    logging.warning(f"Could not resolve agent for reference: {ref}")
-    return None
+    agent = agent_index.get(ref)
+    if agent is None:
+        logging.warning(f"Could not resolve agent for reference: {ref}")
+        return None
+    return parse_label(agent.get("skos:prefLabel"))
 
 
 def check_rights(rights: str | None) -> bool:
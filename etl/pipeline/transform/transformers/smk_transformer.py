@@ -18,21 +18,19 @@ class SmkTransformer(BaseTransformer):
 
     def extract_work_types(self, raw_json: dict) -> list[str]:
         """Extract work types from SMK object_names."""
-        work_types = []
-        object_names = raw_json.get("object_names", [])
-        if object_names:
-            work_types = [
-                obj_name.get("name", "").lower()
-                for obj_name in object_names
-                if obj_name.get("name")
-            ]
-        return work_types
-
-    def extract_searchable_work_types(self, raw_json: dict) -> list[str]:
+        object_names = raw_json.get("object_names") or []
+        return [
+            name.lower() for obj_name in object_names if (name := obj_name.get("name"))
+        ]
+
+    def extract_searchable_work_types(
+        self, raw_json: dict, work_types: Optional[list[str]] = None
+    ) -> list[str]:
         """Extract searchable work types using current helper function."""
         # Default implementation using extracted work type and helper function.
         # We could make a version that is both museum specific and independent of the extracted work types, if needed.
-        work_types = self.extract_work_types(raw_json)
+        if work_types is None:
+            work_types = self.extract_work_types(raw_json)
         return get_searchable_work_types(work_types)
 
     def extract_title(self, raw_json: dict) -> Optional[str]:
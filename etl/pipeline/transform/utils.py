@@ -1,7 +1,22 @@
 import re
+from functools import lru_cache
 from artsearch.src.constants.work_types import SEARCHABLE_WORK_TYPES
 from artsearch.src.utils.work_type_utils import get_standardized_work_type
 
+FOUR_DIGIT_YEAR_PATTERN = re.compile(r"\d{4}")
+
+
+# Matches any searchable work type as a whole word, with an optional plural 's'.
+# Longest alternatives first, so a longer type is never cut short by a shorter one.
+SEARCHABLE_WORK_TYPE_PATTERN = re.compile(
+    r"\b("
+    + "|".join(
+        re.escape(work_type)
+        for work_type in sorted(SEARCHABLE_WORK_TYPES, key=len, reverse=True)
+    )
+    + r")s?\b"
+)
+
 
 def get_searchable_work_types(work_types: list[str]) -> list[str]:
     """
@@ -15,26 +30,35 @@ def get_searchable_work_types(work_types: list[str]) -> list[str]:
     """
     searchable_work_types = set()
     for work_type in work_types:
-        work_type = work_type.lower().strip()
-
-        # Get translated/normalized work type name, if available
-        work_type = get_standardized_work_type(work_type)
-
-        # Match searchable work types using word boundaries to avoid false positives
-        # The 's?' makes the plural 's' optional, so "print" matches both "print" and "prints"
-        # Examples:
-        #  - 'miniature' -> 'miniature' ✓
-        #  - "painting - oil on canvas" -> "painting" ✓
-        #  - "prints and drawings" -> "print" + "drawing" ✓
-        #  - "blueprint" -> no match (avoids false positive for "print") ✓
-        #  - "combustion" -> no match (avoids false positive for "bust") ✓
-        for searchable_work_type in SEARCHABLE_WORK_TYPES:
-            pattern = rf"\b{re.escape(searchable_work_type)}s?\b"
-            if re.search(pattern, work_type):
-                searchable_work_types.add(searchable_work_type)
+        searchable_work_types.update(_match_searchable_work_types(work_type))
     return list(searchable_work_types)
 
 
+@lru_cache(maxsize=4096)
+def _match_searchable_work_types(work_type: str) -> frozenset[str]:
+    """
+    Searchable work types found in a single original work type.
+
+    Museums reuse a small vocabulary of work type strings, so results are cached.
+    """
+    work_type = work_type.lower().strip()
+
+    # Get translated/normalized work type name, if available
+    work_type = get_standardized_work_type(work_type)
+
+    # Match searchable work types using word boundaries to avoid false positives
+    # The 's?' makes the plural 's' optional, so "print" matches both "print" and "prints"
+    # Examples:
+    #  - 'miniature' -> 'miniature' ✓
+    #  - "painting - oil on canvas" -> "painting" ✓
+    #  - "prints and drawings" -> "print" + "drawing" ✓
+    #  - "blueprint" -> no match (avoids false positive for "print") ✓
+    #  - "combustion" -> no match (avoids false positive for "bust") ✓
+    return frozenset(
+        match.group(1) for match in SEARCHABLE_WORK_TYPE_PATTERN.finditer(work_type)
+    )
+
+
 def safe_int_from_date(date_str: str) -> int | None:
     """
     Extract year as integer from date string, handling various formats gracefully.
@@ -48,8 +72,15 @@ def safe_int_from_date(date_str: str) -> int | None:
     if not date_str:
         return None
 
+    date_str = str(date_str)
+
+    # Fast path for ISO dates ("1650-01-01T00:00:00Z"), which start with the year
+    year = date_str[:4]
+    if len(year) == 4 and year.isascii() and year.isdigit():
+        return int(year)
+
     # Extract first 4-digit number from string
-    match = re.search(r"\d{4}", str(date_str))
+    match = FOUR_DIGIT_YEAR_PATTERN.search(date_str)
     if match:
         try:
             return int(match.group())
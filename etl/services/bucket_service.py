@@ -1,4 +1,6 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 import boto3
 from botocore.config import Config
@@ -9,6 +11,13 @@ from PIL import Image
 from artsearch.src.config import config
 from artsearch.src.services.clip_embedder import get_image_response
 
+logger = logging.getLogger(__name__)
+
+# botocore retries throttling (SlowDown/503), transient 5xx errors and dropped
+# connections with exponential backoff + jitter. Adaptive mode also rate-limits
+# the client on throttling, so this is the only retry layer for S3 calls.
+S3_RETRY_CONFIG = {"max_attempts": 8, "mode": "adaptive"}
+
 
 def resize_image_with_aspect_ratio(
     image_bytes: bytes, max_dimension: int = 800, jpeg_quality: int = 85
@@ -74,6 +83,38 @@ def get_bucket_config(use_etl_bucket: bool) -> tuple[str, str]:
         return config.bucket_name_app, config.aws_bucket_region
 
 
+@lru_cache(maxsize=4)
+def _get_s3_client(region: str, aws_access_key_id: str, aws_secret_access_key: str):
+    """
+    Build one boto3 S3 client per (region, credentials) and share it.
+
+    Creating a client loads service models and resolves endpoints, so it is
+    done once per process. boto3 clients are thread-safe, which lets the
+    pooled connections be reused by concurrent uploads and copies.
+    """
+    boto3_cfg = Config(
+        signature_version="s3",
+        connect_timeout=60,
+        read_timeout=60,
+        s3={"addressing_style": "path"},
+        retries=S3_RETRY_CONFIG,
+        # Keep long-lived ingestion connections alive through idle NAT timeouts
+        tcp_keepalive=True,
+        max_pool_connections=64,
+    )
+
+    endpoint_url = f"https://{region}.linodeobjects.com"
+
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        region_name=region,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        config=boto3_cfg,
+    )
+
+
 class BucketService:
     def __init__(
         self,
@@ -84,28 +125,28 @@ class BucketService:
         # Select bucket and region based on context
         self.bucket_name, region = get_bucket_config(use_etl_bucket)
 
-        boto3_cfg = Config(
-            signature_version="s3",
-            connect_timeout=60,
-            read_timeout=60,
-            s3={"addressing_style": "path"},
-        )
+        self.s3 = _get_s3_client(region, aws_access_key_id, aws_secret_access_key)
 
-        endpoint_url = f"https://{region}.linodeobjects.com"
+    def upload_thumbnail(
+        self,
+        museum: str,
+        object_number: str,
+        museum_image_url: str,
+        overwrite: bool = True,
+    ) -> bool:
+        """
+        Download a museum image, resize it and upload it to the bucket.
 
-        self.s3 = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
-            region_name=region,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            config=boto3_cfg,
-        )
+        With overwrite=False, an existing object is left untouched and the
+        museum download is skipped entirely (one HEAD request instead).
 
-    def upload_thumbnail(
-        self, museum: str, object_number: str, museum_image_url: str
-    ) -> None:
+        Returns True if the image was uploaded, False if it was skipped.
+        """
         key = get_bucket_image_key(museum, object_number)
+        if not overwrite and self.object_exists(key):
+            logger.debug("Skipping %s: already in bucket %s", key, self.bucket_name)
+            return False
+
         resp = get_image_response(museum_image_url)
 
         try:
@@ -127,8 +168,8 @@ class BucketService:
             )
             content_type = "image/jpeg"  # Always JPEG after resize
         except Exception as e:
-            logging.warning(f"Failed to resize image for {museum}:{object_number}: {e}")
-            logging.warning("Uploading original image as fallback")
+            logger.warning(f"Failed to resize image for {museum}:{object_number}: {e}")
+            logger.warning("Uploading original image as fallback")
             image_bytes = resp.content
 
         self.s3.put_object(
@@ -139,7 +180,8 @@ class BucketService:
             ContentType=content_type,
             CacheControl=cache_control,
         )
-        logging.info(f"Successfully uploaded {key} to bucket {self.bucket_name}")
+        logger.debug("Successfully uploaded %s to bucket %s", key, self.bucket_name)
+        return True
 
     def copy_thumbnail(self, old_key: str, new_key: str) -> None:
         self.s3.copy_object(
@@ -152,6 +194,37 @@ class BucketService:
             ACL="public-read",
         )
 
+    def copy_thumbnails(
+        self, key_pairs: list[tuple[str, str]], max_workers: int = 32
+    ) -> list[tuple[str, str]]:
+        """
+        Copy many thumbnails concurrently (e.g. when renaming the key scheme).
+
+        Args:
+            key_pairs: List of (old_key, new_key) tuples
+            max_workers: Number of concurrent copy requests
+
+        Returns:
+            The (old_key, new_key) pairs that failed to copy
+        """
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.copy_thumbnail, old_key, new_key): (
+                    old_key,
+                    new_key,
+                )
+                for old_key, new_key in key_pairs
+            }
+            for future in as_completed(futures):
+                old_key, new_key = futures[future]
+                try:
+                    future.result()
+                except ClientError as e:
+                    logger.error(f"Failed to copy {old_key} to {new_key}: {e}")
+                    failed.append((old_key, new_key))
+        return failed
+
     def delete_keys(self, keys: list[str]) -> None:
         if not keys:
             return
@@ -164,9 +237,9 @@ class BucketService:
             )
             errors = response.get("Errors", [])
             if errors:
-                logging.error(f"Errors occurred while deleting keys: {errors}")
+                logger.error(f"Errors occurred while deleting keys: {errors}")
         except ClientError as e:
-            logging.error(f"Failed to delete keys: {e}")
+            logger.error(f"Failed to delete keys: {e}")
 
     def object_exists(self, key: str) -> bool:
         """
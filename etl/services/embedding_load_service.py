@@ -3,7 +3,12 @@ import time
 from typing import Literal, Optional, Dict, List
 from django.db import models, transaction
 from django.db.models import Q
-from qdrant_client.http.models import PointStruct, VectorParams, Distance
+from qdrant_client.http.models import (
+    PointStruct,
+    VectorParams,
+    Distance,
+    PayloadSchemaType,
+)
 import requests
 
 from etl.models import TransformedData
@@ -16,6 +21,10 @@ from artsearch.src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Payload fields the app filters on. Keyword indexes let Qdrant resolve these
+# filters from an index instead of scanning every point's payload.
+PAYLOAD_INDEX_FIELDS = ("museum", "searchable_work_types", "object_number")
+
 
 def is_retryable_error(error: Exception) -> bool:
     """
@@ -192,7 +201,10 @@ class EmbeddingLoadService:
         return count
 
     def _ensure_collection_exists(self):
-        """Create Qdrant collection with 4 named vectors if it doesn't exist."""
+        """
+        Create Qdrant collection with 4 named vectors if it doesn't exist,
+        and make sure the filtered payload fields are indexed.
+        """
         try:
             if not self.qdrant_service.qdrant_client.collection_exists(
                 self.collection_name
@@ -216,10 +228,26 @@ class EmbeddingLoadService:
                 )
             else:
                 logger.info(f"Collection {self.collection_name} already exists")
+
+            self._ensure_payload_indexes()
         except Exception as e:
             logger.error(f"Failed to create/verify Qdrant collection: {e}")
             raise
 
+    def _ensure_payload_indexes(self):
+        """Create keyword payload indexes that don't exist yet (idempotent)."""
+        qdrant_client = self.qdrant_service.qdrant_client
+        existing = qdrant_client.get_collection(self.collection_name).payload_schema
+        for field_name in PAYLOAD_INDEX_FIELDS:
+            if field_name in existing:
+                continue
+            logger.info(f"Creating payload index on {field_name}")
+            qdrant_client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=PayloadSchemaType.KEYWORD,
+            )
+
     def get_records_needing_processing(
         self,
         batch_size: int = 1000,
@@ -367,11 +395,61 @@ class EmbeddingLoadService:
         else:
             raise ValueError(f"Unknown vector type: {vector_type}")
 
+    def _precompute_jina_vectors(
+        self, records: models.QuerySet[TransformedData]
+    ) -> Dict[int, Dict[str, List[float]]]:
+        """
+        Calculate missing Jina vectors for a batch of records with batched API
+        calls. Records whose batch failed are left out and fall back to
+        per-record calculation in process_single_record.
+
+        Sends up to 4 requests of 32 inputs concurrently and does not apply
+        delay_seconds; run_batch_processing skips it when a delay is set.
+
+        Returns:
+            Dict of record pk -> {vector_type: vector}
+        """
+        precomputed: Dict[int, Dict[str, List[float]]] = {
+            record.pk: {} for record in records
+        }
+        jina_embedder = get_jina_embedder()
+
+        image_records = [record for record in records if not record.image_vector_jina]
+        if image_records:
+            image_embeddings = jina_embedder.generate_image_embeddings_batch(
+                [
+                    get_bucket_image_url(
+                        record.museum_slug, record.object_number, use_etl_bucket=True
+                    )
+                    for record in image_records
+                ]
+            )
+            for record, embedding in zip(image_records, image_embeddings):
+                if embedding is not None:
+                    precomputed[record.pk]["image_jina"] = embedding
+
+        # 'Untitled' records are skipped here; _calculate_vector rejects them
+        text_records = [
+            record
+            for record in records
+            if not record.text_vector_jina and record.get_primary_title() != "Untitled"
+        ]
+        if text_records:
+            text_embeddings = jina_embedder.generate_text_embeddings_batch(
+                [record.get_primary_title() for record in text_records]
+            )
+            for record, embedding in zip(text_records, text_embeddings):
+                if embedding is not None:
+                    precomputed[record.pk]["text_jina"] = embedding
+
+        return precomputed
+
     def process_single_record(
         self,
         record: TransformedData,
         delay_seconds: float = 0.0,
         max_retries: int = 3,
+        precomputed_vectors: Optional[Dict[str, List[float]]] = None,
     ) -> Literal["success", "error"]:
         """
         Process a single TransformedData record for embedding generation with retry logic.
@@ -380,6 +458,8 @@ class EmbeddingLoadService:
             record: The TransformedData record to process
             delay_seconds: Delay in seconds after processing to rate limit
             max_retries: Maximum number of retry attempts for transient errors
+            precomputed_vectors: Vectors already calculated by the batch pipeline;
+                used on the first attempt instead of recalculating them
 
         Returns status of the operation.
         """
@@ -413,12 +493,19 @@ class EmbeddingLoadService:
                     vectors_to_calculate,
                 )
 
-                # Calculate needed vectors
+                # Calculate needed vectors (retries always recalculate)
                 calculated_vectors: Dict[str, List[float]] = {}
                 for vector_type in vectors_to_calculate:
-                    calculated_vectors[vector_type] = self._calculate_vector(
-                        vector_type, record
-                    )
+                    if attempt == 0 and precomputed_vectors and (
+                        vector_type in precomputed_vectors
+                    ):
+                        calculated_vectors[vector_type] = precomputed_vectors[
+                            vector_type
+                        ]
+                    else:
+                        calculated_vectors[vector_type] = self._calculate_vector(
+                            vector_type, record
+                        )
 
                 # Create Qdrant point with calculated vectors
                 point = self._create_qdrant_point(record, calculated_vectors)
@@ -499,7 +586,8 @@ class EmbeddingLoadService:
         Args:
             batch_size: Number of records to process in this batch
             museum_filter: Optional museum slug to filter by
-            delay_seconds: Delay in seconds between individual embedding generations
+            delay_seconds: Delay in seconds between individual embedding generations.
+                A non-zero delay disables batched Jina requests.
             batch_delay_seconds: Delay in seconds after completing the batch
 
         Returns:
@@ -525,8 +613,39 @@ class EmbeddingLoadService:
         # Process each record
         stats = {"success": 0, "error": 0}
 
+        # CLIP image embeddings are computed by a pipeline that downloads
+        # upcoming images in the background while earlier records are
+        # embedded and uploaded. Failures are left out, so those records fall
+        # back to per-record calculation (with its retry/error handling).
+        clip_embeddings = self.clip_embedder.generate_thumbnail_embeddings(
+            (
+                get_bucket_image_url(
+                    record.museum_slug, record.object_number, use_etl_bucket=True
+                ),
+                record.object_number,
+            )
+            for record in records
+            if not record.image_vector_clip
+        )
+
+        # Jina vectors are requested in batches (one API call per 32 records,
+        # several in flight). That ignores delay_seconds, so when a delay is set
+        # to rate limit the Jina API, records use the paced per-record path.
+        if delay_seconds > 0:
+            precomputed_jina = {record.pk: {} for record in records}
+        else:
+            precomputed_jina = self._precompute_jina_vectors(records)
+
         for i, record in enumerate(records, 1):
-            status = self.process_single_record(record, delay_seconds)
+            precomputed_vectors = precomputed_jina[record.pk]
+            if not record.image_vector_clip:
+                _, clip_embedding = next(clip_embeddings)
+                if clip_embedding is not None:
+                    precomputed_vectors["image_clip"] = clip_embedding
+
+            status = self.process_single_record(
+                record, delay_seconds, precomputed_vectors=precomputed_vectors
+            )
             stats[status] += 1
 
             if i % 10 == 0:
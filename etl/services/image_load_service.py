@@ -4,6 +4,7 @@ from typing import Literal, Optional
 from django.db import models, transaction
 from django.db.models import Q
 import requests
+from botocore.exceptions import ClientError
 
 from etl.models import TransformedData
 from etl.services.bucket_service import BucketService
@@ -27,6 +28,7 @@ def is_retryable_error(error: Exception) -> bool:
     - 410 Gone
     - Other 4xx errors (bad request, etc.)
     - Invalid content type
+    - S3 ClientErrors (botocore already retries transient ones)
 
     Args:
         error: The exception raised during image download
@@ -38,6 +40,11 @@ def is_retryable_error(error: Exception) -> bool:
     if isinstance(error, (requests.Timeout, requests.ConnectionError)):
         return True
 
+    # S3 errors have been through botocore's adaptive retries already;
+    # retrying the whole record again would multiply the PUTs
+    if isinstance(error, ClientError):
+        return False
+
     # Check for HTTP errors embedded in RuntimeError (from bucket_service)
     if isinstance(error, RuntimeError):
         error_msg = str(error).lower()
@@ -156,6 +163,7 @@ class ImageLoadService:
         record: TransformedData,
         delay_seconds: float = 0.0,
         max_retries: int = 3,
+        overwrite: bool = True,
     ) -> Literal["success", "error"]:
         """
         Process a single TransformedData record for image loading with retry logic.
@@ -164,6 +172,7 @@ class ImageLoadService:
             record: The TransformedData record to process
             delay_seconds: Delay in seconds after processing to rate limit API calls
             max_retries: Maximum number of retry attempts for transient errors
+            overwrite: If False, skip images that are already in the bucket
 
         Returns status of the operation.
         """
@@ -173,10 +182,11 @@ class ImageLoadService:
         for attempt in range(max_retries):
             try:
                 # Download and upload image
-                self.bucket_service.upload_thumbnail(
+                uploaded = self.bucket_service.upload_thumbnail(
                     museum=record.museum_slug,
                     object_number=record.object_number,
                     museum_image_url=record.thumbnail_url,
+                    overwrite=overwrite,
                 )
 
                 # Update record status
@@ -189,7 +199,8 @@ class ImageLoadService:
                 )
 
                 # Rate limiting delay to be respectful to museum APIs
-                if delay_seconds > 0:
+                # (skipped images never hit the museum)
+                if uploaded and delay_seconds > 0:
                     time.sleep(delay_seconds)
 
                 return "success"
@@ -238,6 +249,7 @@ class ImageLoadService:
         museum_filter: Optional[str] = None,
         delay_seconds: float = 0.0,
         batch_delay_seconds: int = 0,
+        overwrite: bool = True,
     ) -> dict[str, int]:
         """
         Run batch processing of image loading.
@@ -247,6 +259,7 @@ class ImageLoadService:
             museum_filter: Optional museum slug to filter by
             delay_seconds: Delay in seconds between individual image downloads
             batch_delay_seconds: Delay in seconds after completing the batch
+            overwrite: If False, skip images that are already in the bucket
 
         Returns:
             Dictionary with counts: {"success": int, "error": int, "total": int}
@@ -272,7 +285,9 @@ class ImageLoadService:
         stats = {"success": 0, "error": 0}
 
         for i, record in enumerate(records, 1):
-            status = self.process_single_record(record, delay_seconds)
+            status = self.process_single_record(
+                record, delay_seconds, overwrite=overwrite
+            )
             stats[status] += 1
 
             if i % 100 == 0:
@@ -3,8 +3,14 @@ Unit tests for bucket_service image resizing functionality.
 """
 import pytest
 from io import BytesIO
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
 from PIL import Image
-from etl.services.bucket_service import resize_image_with_aspect_ratio
+from etl.services.bucket_service import (
+    BucketService,
+    _get_s3_client,
+    resize_image_with_aspect_ratio,
+)
 
 
 @pytest.mark.unit
@@ -154,3 +160,51 @@ class TestImageResizing:
         # Verify output is JPEG
         resized_img = Image.open(BytesIO(resized_bytes))
         assert resized_img.format == "JPEG"
+
+
+@pytest.mark.unit
+class TestS3Retries:
+    """S3 calls are retried by botocore alone, never re-fetching the image."""
+
+    @pytest.fixture
+    def bucket_service(self):
+        service = BucketService.__new__(BucketService)
+        service.bucket_name = "test-bucket"
+        service.s3 = MagicMock()
+        return service
+
+    @pytest.fixture
+    def image_response(self):
+        img = Image.new("RGB", (100, 100), color="green")
+        img_bytes = BytesIO()
+        img.save(img_bytes, format="JPEG")
+
+        response = MagicMock()
+        response.content = img_bytes.getvalue()
+        response.headers = {"Content-Type": "image/jpeg"}
+        return response
+
+    def test_client_uses_adaptive_retries(self):
+        s3 = _get_s3_client("eu-central-1", "test-key", "test-secret")
+
+        assert s3.meta.config.retries == {"max_attempts": 8, "mode": "adaptive"}
+
+    def test_exhausted_slowdown_is_not_retried_again(
+        self, bucket_service, image_response
+    ):
+        # A ClientError reaching BucketService has used up botocore's retries
+        bucket_service.s3.put_object.side_effect = ClientError(
+            {"Error": {"Code": "SlowDown"}}, "PutObject"
+        )
+
+        with patch(
+            "etl.services.bucket_service.get_image_response",
+            return_value=image_response,
+        ) as get_image_response:
+            with pytest.raises(ClientError):
+                bucket_service.upload_thumbnail(
+                    "smk", "KMS1", "https://example.com/image.jpg"
+                )
+
+        get_image_response.assert_called_once()
+        assert bucket_service.s3.put_object.call_count == 1
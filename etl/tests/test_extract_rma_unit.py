@@ -0,0 +1,117 @@
+"""
+Unit tests for the RMA extractor loop, with the RMA API mocked out.
+"""
+import time
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+from etl.models import MetaDataRaw
+from etl.pipeline.extract.extractors import rma_extractor
+from etl.pipeline.extract.helpers.upsert_raw_data import store_raw_data
+
+EXTRACTOR = "etl.pipeline.extract.extractors.rma_extractor"
+
+
+def _search_page(item_ids: list[str], next_page_token: str | None) -> dict:
+    return {
+        "total_count": 4,
+        "items": [{"id": f"https://id.rijksmuseum.nl/{i}"} for i in item_ids],
+        "next_page_token": next_page_token,
+    }
+
+
+def _record(item_id: str) -> dict:
+    return {
+        "metadata": {
+            "rdf:RDF": {"edm:ProvidedCHO": {"dc:identifier": f"SK-{item_id}"}}
+        }
+    }
+
+
+def _fetch_record(item_id, http_session):
+    # Earlier ids finish last, so page order differs from completion order
+    time.sleep(0.01 * (5 - int(item_id)))
+    return _record(item_id)
+
+
+PAGES = {
+    "": _search_page(["1", "2"], "page2"),
+    "page2": _search_page(["3", "4"], None),
+}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestStoreRawDataRma:
+    @pytest.fixture
+    def mocks(self):
+        fetch_page = MagicMock(
+            side_effect=lambda query, session: PAGES[query["pageToken"]]
+        )
+        fetch_record = MagicMock(side_effect=_fetch_record)
+        store = MagicMock(side_effect=store_raw_data)
+        with (
+            patch.object(rma_extractor, "WORK_TYPES", ["painting"]),
+            patch(f"{EXTRACTOR}.get_configured_session", return_value=MagicMock()),
+            patch(f"{EXTRACTOR}.fetch_raw_data_from_rma_api", fetch_page),
+            patch(f"{EXTRACTOR}.fetch_record", fetch_record),
+            patch(f"{EXTRACTOR}.store_raw_data", store),
+        ):
+            yield fetch_page, fetch_record, store
+
+    def test_records_stored_in_page_order(self, mocks):
+        _, _, store = mocks
+
+        rma_extractor.store_raw_data_rma()
+
+        stored_ids = [c.kwargs["museum_db_id"] for c in store.call_args_list]
+        assert stored_ids == ["1", "2", "3", "4"]
+        assert MetaDataRaw.objects.get(museum_db_id="3").object_number == "SK-3"
+
+    def test_prefetched_next_page_is_used(self, mocks):
+        fetch_page, _, _ = mocks
+
+        rma_extractor.store_raw_data_rma()
+
+        # Each search page is requested exactly once: the second page comes from
+        # the prefetch future rather than a second request
+        page_tokens = [c.args[0]["pageToken"] for c in fetch_page.call_args_list]
+        assert page_tokens == ["", "page2"]
+        assert MetaDataRaw.objects.filter(museum_slug="rma").count() == 4
+
+    def test_already_stored_records_are_skipped(self, mocks):
+        _, fetch_record, _ = mocks
+        store_raw_data("rma", "SK-2", _record("2"), museum_db_id="2")
+
+        rma_extractor.store_raw_data_rma()
+
+        fetched_ids = sorted(c.args[0] for c in fetch_record.call_args_list)
+        assert fetched_ids == ["1", "3", "4"]
+
+    def test_force_refetch_fetches_stored_records(self, mocks):
+        _, fetch_record, _ = mocks
+        store_raw_data("rma", "SK-2", _record("2"), museum_db_id="2")
+
+        rma_extractor.store_raw_data_rma(force_refetch=True)
+
+        fetched_ids = sorted(c.args[0] for c in fetch_record.call_args_list)
+        assert fetched_ids == ["1", "2", "3", "4"]
+        assert MetaDataRaw.objects.filter(museum_slug="rma").count() == 4
+
+    def test_malformed_search_page_stops_work_type(self, mocks):
+        fetch_page, _, _ = mocks
+
+        def fetch(query, session):
+            if query["pageToken"] == "page2":
+                orjson.loads(b"<html>Bad Gateway</html>")
+            return PAGES[query["pageToken"]]
+
+        fetch_page.side_effect = fetch
+
+        # The undecodable page is logged and ends the work type instead of
+        # aborting the run
+        rma_extractor.store_raw_data_rma()
+
+        assert MetaDataRaw.objects.filter(museum_slug="rma").count() == 2
@@ -781,3 +781,170 @@ def test_new_record_does_not_fetch_existing_vectors():
     mock_clip_embedder.generate_thumbnail_embedding.assert_called_once()
     mock_jina_embedder.generate_image_embedding.assert_called_once()
     mock_jina_embedder.generate_text_embedding.assert_called_once()
+
+
+def _make_service(mock_clip_embedder):
+    mock_qdrant_service = Mock()
+    mock_qdrant_client = MagicMock()
+    mock_qdrant_client.collection_exists.return_value = True
+    mock_qdrant_service.qdrant_client = mock_qdrant_client
+    service = EmbeddingLoadService(
+        collection_name="test_collection",
+        clip_embedder=mock_clip_embedder,
+        qdrant_service=mock_qdrant_service,
+    )
+    return service, mock_qdrant_service
+
+
+def _make_record(object_number: str, title: str | None = "A ship in a storm"):
+    return TransformedData.objects.create(
+        museum_slug="tst",
+        object_number=object_number,
+        museum_db_id=object_number,
+        searchable_work_types=["painting"],
+        thumbnail_url="https://example.com/thumb.jpg",
+        title=title,
+        image_loaded=True,
+    )
+
+
+def _uploaded_vectors(mock_qdrant_service, call_index: int) -> dict:
+    points = mock_qdrant_service.upload_points.call_args_list[call_index][0][0]
+    return points[0].vector
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_precomputed_jina_vectors_stay_with_their_records():
+    """
+    Batched Jina embeddings must land on the record they were requested for;
+    records in a failed batch or without a title get no precomputed vector.
+    """
+    titled = _make_record("T1")
+    failed = _make_record("T2", title=None)
+
+    mock_jina_embedder = Mock()
+    mock_jina_embedder.generate_image_embeddings_batch.return_value = [
+        [0.5] * 256,
+        None,
+    ]
+    mock_jina_embedder.generate_text_embeddings_batch.return_value = [[0.6] * 256]
+
+    service, _ = _make_service(Mock())
+    records = service.get_records_needing_processing(museum_filter="tst")
+    with patch(
+        "etl.services.embedding_load_service.get_jina_embedder",
+        return_value=mock_jina_embedder,
+    ):
+        precomputed = service._precompute_jina_vectors(records)
+
+    assert precomputed == {
+        titled.pk: {"image_jina": [0.5] * 256, "text_jina": [0.6] * 256},
+        failed.pk: {},
+    }
+    # 'Untitled' records are not sent for text embedding
+    mock_jina_embedder.generate_text_embeddings_batch.assert_called_once_with(
+        ["A ship in a storm"]
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_precomputed_vectors_are_only_used_on_the_first_attempt():
+    """A retry after a transient error recalculates every vector."""
+    record = _make_record("R1")
+
+    mock_clip_embedder = Mock()
+    mock_clip_embedder.generate_thumbnail_embedding.return_value = [0.9] * 768
+    mock_jina_embedder = Mock()
+    mock_jina_embedder.generate_image_embedding.return_value = [0.8] * 256
+    mock_jina_embedder.generate_text_embedding.return_value = [0.7] * 256
+
+    service, mock_qdrant_service = _make_service(mock_clip_embedder)
+    mock_qdrant_service.upload_points.side_effect = [
+        requests.ConnectionError("connection reset"),
+        None,
+    ]
+    precomputed = {
+        "image_clip": [0.1] * 768,
+        "image_jina": [0.2] * 256,
+        "text_jina": [0.3] * 256,
+    }
+
+    with patch(
+        "etl.services.embedding_load_service.get_jina_embedder",
+        return_value=mock_jina_embedder,
+    ), patch("etl.services.embedding_load_service.time.sleep"):
+        status = service.process_single_record(
+            record, precomputed_vectors=precomputed
+        )
+
+    assert status == "success"
+    first_attempt = _uploaded_vectors(mock_qdrant_service, 0)
+    assert first_attempt["image_clip"] == [0.1] * 768
+    assert first_attempt["image_jina"] == [0.2] * 256
+    assert first_attempt["text_jina"] == [0.3] * 256
+
+    retry = _uploaded_vectors(mock_qdrant_service, 1)
+    assert retry["image_clip"] == [0.9] * 768
+    assert retry["image_jina"] == [0.8] * 256
+    assert retry["text_jina"] == [0.7] * 256
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_run_batch_processing_uses_batched_vectors():
+    """Batch runs upload the pipelined CLIP and batched Jina vectors."""
+    _make_record("B1")
+
+    mock_clip_embedder = Mock()
+    mock_clip_embedder.generate_thumbnail_embeddings.return_value = iter(
+        [("B1", [0.1] * 768)]
+    )
+    mock_jina_embedder = Mock()
+    mock_jina_embedder.generate_image_embeddings_batch.return_value = [[0.2] * 256]
+    mock_jina_embedder.generate_text_embeddings_batch.return_value = [[0.3] * 256]
+
+    service, mock_qdrant_service = _make_service(mock_clip_embedder)
+    with patch(
+        "etl.services.embedding_load_service.get_jina_embedder",
+        return_value=mock_jina_embedder,
+    ):
+        stats = service.run_batch_processing(museum_filter="tst")
+
+    assert stats == {"success": 1, "error": 0, "total": 1}
+    vectors = _uploaded_vectors(mock_qdrant_service, 0)
+    assert vectors["image_clip"] == [0.1] * 768
+    assert vectors["image_jina"] == [0.2] * 256
+    assert vectors["text_jina"] == [0.3] * 256
+    mock_clip_embedder.generate_thumbnail_embedding.assert_not_called()
+    mock_jina_embedder.generate_image_embedding.assert_not_called()
+    mock_jina_embedder.generate_text_embedding.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_run_batch_processing_with_delay_skips_batched_jina_requests():
+    """delay_seconds paces Jina calls, so the concurrent batch path is skipped."""
+    _make_record("D1")
+
+    mock_clip_embedder = Mock()
+    mock_clip_embedder.generate_thumbnail_embeddings.return_value = iter(
+        [("D1", [0.1] * 768)]
+    )
+    mock_jina_embedder = Mock()
+    mock_jina_embedder.generate_image_embedding.return_value = [0.2] * 256
+    mock_jina_embedder.generate_text_embedding.return_value = [0.3] * 256
+
+    service, _ = _make_service(mock_clip_embedder)
+    with patch(
+        "etl.services.embedding_load_service.get_jina_embedder",
+        return_value=mock_jina_embedder,
+    ), patch("etl.services.embedding_load_service.time.sleep"):
+        stats = service.run_batch_processing(museum_filter="tst", delay_seconds=1.0)
+
+    assert stats["success"] == 1
+    mock_jina_embedder.generate_image_embeddings_batch.assert_not_called()
+    mock_jina_embedder.generate_text_embeddings_batch.assert_not_called()
+    mock_jina_embedder.generate_image_embedding.assert_called_once()
+    mock_jina_embedder.generate_text_embedding.assert_called_once()
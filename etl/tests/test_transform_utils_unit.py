@@ -0,0 +1,45 @@
+"""
+Unit tests for the shared transform helpers.
+"""
+import pytest
+from etl.pipeline.transform.utils import get_searchable_work_types, safe_int_from_date
+
+
+@pytest.mark.unit
+class TestGetSearchableWorkTypes:
+    """Unit tests for mapping original work types to searchable work types."""
+
+    @pytest.mark.parametrize(
+        "work_types, expected",
+        [
+            (["miniature"], {"miniature"}),
+            (["Painting - oil on canvas"], {"painting"}),
+            (["prints and drawings"], {"print", "drawing"}),
+            (["blueprint"], set()),
+            (["combustion"], set()),
+            (["aquarel"], {"watercolor"}),
+            (["drawing", "Drawings"], {"drawing"}),
+            ([], set()),
+        ],
+    )
+    def test_matches_whole_words(self, work_types, expected):
+        assert set(get_searchable_work_types(work_types)) == expected
+
+
+@pytest.mark.unit
+class TestSafeIntFromDate:
+    """Unit tests for extracting a year from a date string."""
+
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("1650-01-01T00:00:00Z", 1650),
+            ("1650", 1650),
+            ("ca. 1650", 1650),
+            ("invalid", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_extracts_year(self, date_str, expected):
+        assert safe_int_from_date(date_str) == expected